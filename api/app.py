@@ -4,19 +4,63 @@ Serves normalized product data from JSON files through REST endpoints
 """
 
 import os
+
+if os.getenv("USE_GEVENT") == "1":
+    # Patch blocking I/O before Flask and friends are imported so file reads yield to other requests
+    from gevent import monkey
+    monkey.patch_all()
+
+import csv
+import glob
 import json
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+import functools
+import hashlib
+import heapq
+import itertools
+import mimetypes
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
+from urllib.parse import quote
+
+import orjson
 
-from flask import Flask, jsonify, request, render_template, send_from_directory, url_for, send_from_directory
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+from flask import Flask, Response, jsonify, make_response, request, render_template, send_from_directory, url_for, send_from_directory
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
 from flask_cors import CORS
 from werkzeug.exceptions import NotFound, BadRequest
+from werkzeug.security import safe_join
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, used by jsonify() for every response"""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
 
 # === Configuration ===
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)  # Enable CORS for frontend access
 
+# Compress JSON and HTML responses, preferring brotli when the client accepts it
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_MIMETYPES"] = ["application/json", "text/html", "text/css", "application/javascript"]
+Compress(app)
+
 # Get project root and data directories
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
@@ -28,6 +72,13 @@ INTERNAL_DATA_DIR = os.path.join(PROJECT_ROOT, "data")
 IMAGES_DIR = os.path.join(PROJECT_ROOT, "images")
 BROCHURES_DIR = os.path.join(PROJECT_ROOT, "brochures")
 
+# Optional nginx offload for file downloads: when set (e.g. "/_internal"), responses carry an
+# X-Accel-Redirect header to internal locations {prefix}/brochures/ and {prefix}/static/
+X_ACCEL_REDIRECT_PREFIX = os.getenv("X_ACCEL_REDIRECT_PREFIX", "").rstrip("/")
+
+# Cache-Control max-age (seconds) for brochures and static files served by Flask itself
+FILE_MAX_AGE = int(os.getenv("FILE_MAX_AGE", "3600"))
+
 # Supported product types and data stages
 PRODUCT_TYPES = ["phones", "tv", "watch"]
 DATA_STAGES = {
@@ -38,43 +89,118 @@ DATA_STAGES = {
     "internal": INTERNAL_DATA_DIR
 }
 
+# Internal CSV filenames per product type
+INTERNAL_CSV_FILES = {
+    "phones": "samsung_galaxy_s24_detailed.csv",
+    "tv": "samsung_frame_tv_detailed.csv",
+    "watch": "samsung_watch6_classic_detailed.csv"
+}
+
+# Pre-resolved paths for every single-file stage; raw is a glob over many scrape files
+FILE_PATHS = {
+    (product_type, stage): os.path.join(
+        directory,
+        INTERNAL_CSV_FILES[product_type] if stage == "internal"
+        else f"{product_type}_llm_normalized.json" if stage == "normalized"
+        else f"{product_type}_{stage}.json"
+    )
+    for product_type in PRODUCT_TYPES
+    for stage, directory in DATA_STAGES.items()
+    if stage != "raw"
+}
+
+# Last observed mtimes as path -> (checked_at, mtime_ns); re-stat at most every STAT_CACHE_TTL seconds
+STAT_CACHE_TTL = float(os.getenv("STAT_CACHE_TTL", "1.0"))
+FILE_MTIMES: Dict[str, Tuple[float, int]] = {}
+
 # === Data Loading Utilities ===
-def load_product_data(product_type: str, stage: str = "normalized") -> Dict[str, Any]:
-    """Load product data for a given product type and processing stage"""
+def _file_mtime_ns(path: str) -> int:
+    """Return a file's mtime_ns, reusing a recent stat result within STAT_CACHE_TTL"""
+    now = time.monotonic()
+    cached = FILE_MTIMES.get(path)
+    if cached and now - cached[0] < STAT_CACHE_TTL:
+        return cached[1]
+    
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        FILE_MTIMES.pop(path, None)
+        raise
+    FILE_MTIMES[path] = (now, mtime)
+    return mtime
+
+def _stage_files(product_type: str, stage: str, raw_date: Optional[str] = None,
+                 raw_source: Optional[str] = None) -> List[str]:
+    """Resolve the file paths backing a product type at a given processing stage
+    
+    For the raw stage, ``raw_date`` (YYYYMMDD) and ``raw_source`` drop scrape files
+    from other dates/sources using the filename alone, before anything is opened or parsed.
+    """
+    if stage == "raw":
+        # Raw data contains individual scrape files
+        pattern = os.path.join(DATA_STAGES[stage], f"{product_type}_*.json")
+        files = sorted(glob.glob(pattern))
+        
+        if not files:
+            raise FileNotFoundError(f"No raw data found for product type: {product_type}")
+        
+        # Expected format: {product_type}_{source}_{date}_{time}.json
+        if raw_date:
+            files = [f for f in files if os.path.basename(f).split('_')[2:3] == [raw_date]]
+        if raw_source:
+            files = [f for f in files if os.path.basename(f).split('_')[1:2] == [raw_source]]
+        return files
+    
+    file_path = FILE_PATHS.get((product_type, stage))
+    if file_path is None:
+        raise FileNotFoundError(f"No {stage} data found for product type: {product_type}")
+    return [file_path]
+
+def _validate_product_stage(product_type: str, stage: str) -> None:
+    """Raise ValueError for unknown product types or data stages"""
     if product_type not in PRODUCT_TYPES:
         raise ValueError(f"Invalid product type. Must be one of: {PRODUCT_TYPES}")
     
     if stage not in DATA_STAGES:
         raise ValueError(f"Invalid data stage. Must be one of: {list(DATA_STAGES.keys())}")
+
+def _stage_fingerprint(product_type: str, stage: str, raw_date: Optional[str] = None,
+                       raw_source: Optional[str] = None) -> Tuple[Tuple[str, int], ...]:
+    """Build a cache key of (path, mtime_ns) pairs for the files backing a stage"""
+    try:
+        files = _stage_files(product_type, stage, raw_date, raw_source)
+        return tuple((path, _file_mtime_ns(path)) for path in files)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"No {stage} data found for product type: {product_type}")
+
+def load_product_data(product_type: str, stage: str = "normalized", raw_date: Optional[str] = None,
+                      raw_source: Optional[str] = None) -> Dict[str, Any]:
+    """Load product data for a given product type and processing stage
     
+    Parsed data is memoized per file modification time, so callers must treat
+    the returned structure as read-only and copy before mutating it.
+    ``raw_date`` and ``raw_source`` restrict the raw stage to matching scrape files.
+    """
+    _validate_product_stage(product_type, stage)
+    return _load_cached(product_type, stage, _stage_fingerprint(product_type, stage, raw_date, raw_source))
+
+@functools.lru_cache(maxsize=64)
+def _load_cached(product_type: str, stage: str, fingerprint: Tuple[Tuple[str, int], ...]) -> Dict[str, Any]:
+    """Parse the files listed in the fingerprint (a new mtime yields a new cache entry)"""
     if stage == "internal":
-        # Internal data is in CSV format
-        file_path = os.path.join(DATA_STAGES[stage], f"samsung_{product_type.replace('tv', 'frame_tv')}_detailed.csv")
-        if product_type == "phones":
-            file_path = os.path.join(DATA_STAGES[stage], "samsung_galaxy_s24_detailed.csv")
-        elif product_type == "watch":
-            file_path = os.path.join(DATA_STAGES[stage], "samsung_watch6_classic_detailed.csv")
-        
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"No internal data found for product type: {product_type}")
-        
-        # Convert CSV to JSON-like structure
-        import pandas as pd
-        df = pd.read_csv(file_path)
-        return {"internal_data": df.to_dict(orient="records")}
+        # Convert CSV to JSON-like structure in a single pass (empty cells become null)
+        file_path = fingerprint[0][0]
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            records = [
+                {column: (value if value != "" else None) for column, value in row.items()}
+                for row in csv.DictReader(f)
+            ]
+        return {"internal_data": records}
     
     elif stage == "raw":
-        # Raw data contains individual scrape files
-        import glob
-        pattern = os.path.join(DATA_STAGES[stage], f"{product_type}_*.json")
-        files = glob.glob(pattern)
-        
-        if not files:
-            raise FileNotFoundError(f"No raw data found for product type: {product_type}")
-        
         # Group files by source and date
         raw_data = {}
-        for file_path in files:
+        for file_path, _ in fingerprint:
             filename = os.path.basename(file_path)
             parts = filename.replace('.json', '').split('_')
             if len(parts) >= 4:
@@ -86,23 +212,114 @@ def load_product_data(product_type: str, stage: str = "normalized") -> Dict[str,
                 if datetime_key not in raw_data:
                     raw_data[datetime_key] = {}
                 
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    raw_data[datetime_key][source] = json.load(f)
+                with open(file_path, 'rb') as f:
+                    raw_data[datetime_key][source] = orjson.loads(f.read())
         
         return raw_data
     
     else:
-        # For combined, aggregated, and normalized data
-        if stage == "normalized":
-            file_path = os.path.join(DATA_STAGES[stage], f"{product_type}_llm_normalized.json")
-        else:
-            file_path = os.path.join(DATA_STAGES[stage], f"{product_type}_{stage}.json")
+        file_path = fingerprint[0][0]
         
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"No {stage} data found for product type: {product_type}")
+        # Prefer a MessagePack sidecar (scripts/convert_normalized_to_msgpack.py) that is not older than the JSON
+        sidecar_path = os.path.splitext(file_path)[0] + ".msgpack"
+        if msgpack is not None and stage == "normalized" and os.path.exists(sidecar_path):
+            if os.stat(sidecar_path).st_mtime_ns >= fingerprint[0][1]:
+                with open(sidecar_path, 'rb') as f:
+                    return msgpack.unpackb(f.read(), raw=False)
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+
+def load_searchable_products(product_type: str, stage: str = "normalized") -> List[Tuple[Dict[str, Any], str]]:
+    """Load (product, lowercased JSON text) pairs used by the search endpoint"""
+    _validate_product_stage(product_type, stage)
+    return _searchable_cached(product_type, stage, _stage_fingerprint(product_type, stage))
+
+@functools.lru_cache(maxsize=64)
+def _searchable_cached(product_type: str, stage: str, fingerprint: Tuple[Tuple[str, int], ...]) -> List[Tuple[Dict[str, Any], str]]:
+    """Serialize each product once per fingerprint so searches only run substring scans"""
+    data = _load_cached(product_type, stage, fingerprint)
+    
+    if stage == "internal":
+        products = data.get("internal_data", [])
+    elif isinstance(data, dict):
+        products = []
+        for date_key, date_data in data.items():
+            if isinstance(date_data, list):
+                products.extend(date_data)
+            else:
+                products.append(date_data)
+    else:
+        products = [data]
+    
+    return [
+        (product, json.dumps(product, default=str).lower())
+        for product in products
+        if isinstance(product, dict)
+    ]
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+@functools.lru_cache(maxsize=64)
+def _token_index_cached(product_type: str, stage: str, fingerprint: Tuple[Tuple[str, int], ...]) -> Dict[str, List[int]]:
+    """Map each alphanumeric token in the searchable text to the positions of products containing it"""
+    index: Dict[str, List[int]] = {}
+    for position, (product, searchable_text) in enumerate(_searchable_cached(product_type, stage, fingerprint)):
+        for token in set(_TOKEN_RE.findall(searchable_text)):
+            index.setdefault(token, []).append(position)
+    return index
+
+def find_searchable_products(product_type: str, stage: str, query_lower: str) -> List[Tuple[Dict[str, Any], str]]:
+    """Return (product, text) pairs whose searchable text contains ``query_lower``
+    
+    Alphanumeric queries are answered from the token index: any product containing
+    the query must have a token containing it, so only the token vocabulary is
+    scanned. Queries with spaces or punctuation fall back to a linear scan.
+    """
+    _validate_product_stage(product_type, stage)
+    fingerprint = _stage_fingerprint(product_type, stage)
+    entries = _searchable_cached(product_type, stage, fingerprint)
+    
+    if not _TOKEN_RE.fullmatch(query_lower):
+        return [entry for entry in entries if query_lower in entry[1]]
+    
+    positions = set()
+    for token, token_positions in _token_index_cached(product_type, stage, fingerprint).items():
+        if query_lower in token:
+            positions.update(token_positions)
+    return [entries[position] for position in sorted(positions)]
+
+# Latest normalized entry per product type as product_type -> (fingerprint, date, product);
+# kept outside the LRU so /latest stays cheap even after the full payload is evicted
+_LATEST: Dict[str, Tuple[Tuple[Tuple[str, int], ...], Optional[str], Any]] = {}
+
+def get_latest_entry(product_type: str) -> Tuple[Optional[str], Any]:
+    """Return (latest date, product) from the normalized data, recomputed only when the file changes"""
+    _validate_product_stage(product_type, "normalized")
+    fingerprint = _stage_fingerprint(product_type, "normalized")
+    cached = _LATEST.get(product_type)
+    if cached and cached[0] == fingerprint:
+        return cached[1], cached[2]
+    
+    data = _load_cached(product_type, "normalized", fingerprint)
+    latest_date = max(data.keys()) if data else None
+    product = data[latest_date] if data else None
+    _LATEST[product_type] = (fingerprint, latest_date, product)
+    return latest_date, product
+
+# Directory listings keyed by path -> (mtime_ns, entries); refreshed when the directory changes
+_DIR_CACHE: Dict[str, Tuple[int, List[str]]] = {}
+
+def _cached_listdir(directory: str) -> List[str]:
+    """List a directory, reusing the previous listing while its mtime is unchanged"""
+    mtime = os.stat(directory).st_mtime_ns
+    cached = _DIR_CACHE.get(directory)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    entries = os.listdir(directory)
+    _DIR_CACHE[directory] = (mtime, entries)
+    return entries
 
 def get_available_brochures(product_type: str = None) -> List[str]:
     """Get available PDF brochures"""
@@ -110,31 +327,381 @@ def get_available_brochures(product_type: str = None) -> List[str]:
         return []
     
     brochures = []
-    for filename in os.listdir(BROCHURES_DIR):
+    for filename in _cached_listdir(BROCHURES_DIR):
         if filename.endswith('.pdf'):
             if product_type is None or filename.startswith(product_type):
                 brochures.append(filename)
     
     return sorted(brochures)
 
+# Expected format: {product_type}_{source}_{date}_{hash}.{ext}; source/date are optional
+_IMAGE_RE = re.compile(
+    r"^(" + "|".join(map(re.escape, PRODUCT_TYPES)) + r")_(?:([^_]*)_([^_]*)_)?.*\.(?i:jpe?g|png|webp|gif)\Z",
+    re.DOTALL
+)
+
+# Image filenames grouped as product_type -> (source, date) -> filenames, rebuilt when IMAGES_DIR changes
+_IMAGE_INDEX: Dict[str, Tuple[int, Dict[str, Dict[Tuple[str, str], List[str]]]]] = {}
+
+def _image_index() -> Dict[str, Dict[Tuple[str, str], List[str]]]:
+    """Index image filenames by product type, source and date in a single directory pass"""
+    mtime = os.stat(IMAGES_DIR).st_mtime_ns
+    cached = _IMAGE_INDEX.get(IMAGES_DIR)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    index = {product_type: {} for product_type in PRODUCT_TYPES}
+    for filename in sorted(_cached_listdir(IMAGES_DIR)):
+        match = _IMAGE_RE.match(filename)
+        if not match:
+            continue
+        product_type, source, date = match.groups()
+        # Filenames without source/date still count as images but are not grouped
+        key = (source, date) if source is not None else ("", "")
+        index[product_type].setdefault(key, []).append(filename)
+    
+    _IMAGE_INDEX[IMAGES_DIR] = (mtime, index)
+    return index
+
 def get_product_images(product_type: str, date: str = None, source: str = None) -> List[str]:
     """Get image filenames for a product type"""
     if not os.path.exists(IMAGES_DIR):
         return []
     
     images = []
-    for filename in os.listdir(IMAGES_DIR):
-        if filename.lower().endswith(('.jpg', '.jpeg', '.png', '.webp', '.gif')):
-            # Expected format: {product_type}_{source}_{date}_{hash}.{ext}
-            if filename.startswith(f"{product_type}_"):
-                if source and f"_{source}_" not in filename:
-                    continue
-                if date and date not in filename:
-                    continue
-                images.append(filename)
+    for (img_source, img_date), filenames in _image_index().get(product_type, {}).items():
+        if source and img_source != source:
+            continue
+        if date and date != img_date:
+            # Dates may also be given as YYYYMMDD_HHMMSS or a partial value
+            filenames = [filename for filename in filenames if date in filename]
+        images.extend(filenames)
     
     return sorted(images)
 
+def get_images_by_source_date(product_type: str, date: str = None, source: str = None) -> Dict[str, List[str]]:
+    """Group image filenames for a product type under "{source}_{date}" keys"""
+    if not os.path.exists(IMAGES_DIR):
+        return {}
+    
+    images_info = {}
+    for (img_source, img_date), filenames in _image_index().get(product_type, {}).items():
+        if not img_source or (source and img_source != source):
+            continue
+        if date and date != img_date:
+            filenames = [filename for filename in filenames if date in filename]
+        if filenames:
+            images_info[f"{img_source}_{img_date}"] = filenames
+    
+    return images_info
+
+# /products availability snapshot, keyed by the fingerprint of every file and directory it summarizes
+_PRODUCTS_SNAPSHOT: Dict[str, Tuple[Tuple, Dict[str, Any]]] = {}
+
+def _products_fingerprint() -> Tuple:
+    """Collect stage fingerprints plus image/brochure directory mtimes for the /products snapshot"""
+    parts = []
+    for product_type in PRODUCT_TYPES:
+        for stage in DATA_STAGES.keys():
+            try:
+                parts.append((product_type, stage, _stage_fingerprint(product_type, stage)))
+            except FileNotFoundError:
+                parts.append((product_type, stage, None))
+    
+    for directory in (IMAGES_DIR, BROCHURES_DIR):
+        try:
+            parts.append((directory, _file_mtime_ns(directory)))
+        except FileNotFoundError:
+            parts.append((directory, None))
+    
+    return tuple(parts)
+
+def get_products_snapshot() -> Dict[str, Any]:
+    """Summarize counts and dates per product type and stage, rebuilt only when files change"""
+    fingerprint = _products_fingerprint()
+    cached = _PRODUCTS_SNAPSHOT.get("products")
+    if cached and cached[0] == fingerprint:
+        return cached[1]
+    
+    stage_fingerprints = {(product_type, stage): files for product_type, stage, files in fingerprint[:-2]}
+    products_info = {}
+    
+    for product_type in PRODUCT_TYPES:
+        type_info = {
+            "available_stages": {},
+            "total_stages_available": 0,
+            "latest_date": None,
+            "image_count": len(get_product_images(product_type)),
+            "brochure_count": len(get_available_brochures(product_type))
+        }
+        
+        # Check each data stage
+        for stage in DATA_STAGES.keys():
+            try:
+                files = stage_fingerprints[(product_type, stage)]
+                if files is None:
+                    raise FileNotFoundError(f"No {stage} data found for product type: {product_type}")
+                
+                data = _load_cached(product_type, stage, files)
+                if stage == "internal":
+                    count = len(data.get("internal_data", []))
+                    dates = ["internal"]
+                elif stage == "raw":
+                    count = len(data)
+                    dates = list(data.keys())
+                else:
+                    count = len(data)
+                    dates = list(data.keys()) if isinstance(data, dict) else []
+                
+                type_info["available_stages"][stage] = {
+                    "available": True,
+                    "count": count,
+                    "dates": dates
+                }
+                type_info["total_stages_available"] += 1
+                
+                # Get latest date from normalized stage if available
+                if stage == "normalized" and dates:
+                    type_info["latest_date"] = max(dates)
+                    
+            except (FileNotFoundError, ValueError):
+                type_info["available_stages"][stage] = {
+                    "available": False,
+                    "count": 0,
+                    "dates": []
+                }
+        
+        products_info[product_type] = type_info
+    
+    _PRODUCTS_SNAPSHOT["products"] = (fingerprint, products_info)
+    return products_info
+
+def send_file_from(directory: str, location: str, filename: str, **kwargs) -> Response:
+    """Send a file from a directory, delegating the transfer to nginx when X-Accel-Redirect is enabled"""
+    if not X_ACCEL_REDIRECT_PREFIX:
+        # Conditional responses answer Range/If-None-Match themselves, and the file body is handed
+        # to the server's wsgi.file_wrapper so gunicorn can transfer it with sendfile()
+        kwargs.setdefault("conditional", True)
+        kwargs.setdefault("max_age", FILE_MAX_AGE)
+        return send_from_directory(directory, filename, **kwargs)
+    
+    file_path = safe_join(directory, filename)
+    if file_path is None or not os.path.isfile(file_path):
+        raise NotFound()
+    
+    mimetype = kwargs.get("mimetype") or mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    response = Response(status=200, mimetype=mimetype)
+    # Percent-encoded, so names with spaces, '%' or non-ASCII characters still map to the right internal URI
+    response.headers["X-Accel-Redirect"] = f"{X_ACCEL_REDIRECT_PREFIX}/{location}/{quote(filename)}"
+    if kwargs.get("as_attachment"):
+        response.headers.set("Content-Disposition", "attachment", filename=filename)
+    return response
+
+# === Cache Warm-up ===
+def warm_caches() -> None:
+    """Load every stage, search index and directory listing so early requests skip cold loads"""
+    for product_type in PRODUCT_TYPES:
+        for stage in DATA_STAGES.keys():
+            try:
+                load_product_data(product_type, stage)
+                load_searchable_products(product_type, stage)
+                _token_index_cached(product_type, stage, _stage_fingerprint(product_type, stage))
+            except (FileNotFoundError, ValueError):
+                continue
+        
+        try:
+            get_latest_entry(product_type)
+        except (FileNotFoundError, ValueError):
+            pass
+        get_product_images(product_type)
+        get_available_brochures(product_type)
+    
+    get_products_snapshot()
+
+def start_cache_refresher(interval: float) -> threading.Thread:
+    """Re-run warm_caches every ``interval`` seconds so changed files are reloaded off the request path"""
+    def refresh():
+        while True:
+            time.sleep(interval)
+            try:
+                warm_caches()
+            except Exception as e:
+                print(f"[!] Cache refresh failed: {e}")
+    
+    thread = threading.Thread(target=refresh, name="cache-refresher", daemon=True)
+    thread.start()
+    return thread
+
+# === HTTP Caching ===
+def _data_fingerprint(product_types: List[str], stages: List[str], directories: Tuple[str, ...] = ()) -> Tuple[Tuple[str, int], ...]:
+    """Flatten (path, mtime_ns) pairs for the stage files and directories behind a response"""
+    pairs = []
+    for product_type in product_types:
+        for stage in stages:
+            if stage not in DATA_STAGES:
+                continue
+            try:
+                pairs.extend(_stage_fingerprint(product_type, stage))
+            except FileNotFoundError:
+                continue
+    
+    for directory in directories:
+        try:
+            pairs.append((directory, _file_mtime_ns(directory)))
+        except FileNotFoundError:
+            continue
+    
+    return tuple(pairs)
+
+def _checked_fingerprint(product_type: str, stage: str, directories: Tuple[str, ...] = (),
+                         raw_date: Optional[str] = None, raw_source: Optional[str] = None) -> Tuple[Tuple[str, int], ...]:
+    """Like _data_fingerprint for one type/stage, but raise the view's 400/404 for unknown types or missing files"""
+    try:
+        _validate_product_stage(product_type, stage)
+        pairs = _stage_fingerprint(product_type, stage, raw_date, raw_source)
+    except ValueError as e:
+        raise BadRequest(str(e))
+    except FileNotFoundError as e:
+        raise NotFound(str(e))
+    return pairs + _data_fingerprint([], [], directories)
+
+def _products_by_type_fingerprint(product_type: str) -> Tuple[Tuple[str, int], ...]:
+    """Fingerprint for /products/<type>, rejecting bad stages, dates and paging before the view"""
+    stage = request.args.get('stage', 'normalized')
+    fingerprint = _checked_fingerprint(product_type, stage, (IMAGES_DIR,))
+    date_filter = request.args.get('date')
+    if date_filter and stage != "internal":
+        data = load_product_data(product_type, stage)
+        if isinstance(data, dict) and date_filter not in data:
+            raise NotFound(f"No product found for date: {date_filter}")
+    _paging_args()
+    return fingerprint
+
+def _product_by_date_fingerprint(product_type: str, date: str) -> Tuple[Tuple[str, int], ...]:
+    """Fingerprint for /products/<type>/<date>, answering 404 for dates the cached data lacks"""
+    fingerprint = _checked_fingerprint(product_type, "normalized", (IMAGES_DIR,))
+    if date not in load_product_data(product_type):
+        raise NotFound(f"No {product_type} product found for date: {date}")
+    return fingerprint
+
+def _latest_product_fingerprint(product_type: str) -> Tuple[Tuple[str, int], ...]:
+    """Fingerprint for /products/<type>/latest, answering 404 when the normalized data is empty"""
+    fingerprint = _checked_fingerprint(product_type, "normalized", (IMAGES_DIR,))
+    if get_latest_entry(product_type)[0] is None:
+        raise NotFound(f"No products found for type: {product_type}")
+    return fingerprint
+
+def _raw_fingerprint(product_type: str) -> Tuple[Tuple[str, int], ...]:
+    """Fingerprint for /raw/<type> over only the scrape files its date/source filters select"""
+    fingerprint = _checked_fingerprint(product_type, "raw", raw_date=request.args.get('date'),
+                                       raw_source=request.args.get('source'))
+    _paging_args()
+    return fingerprint
+
+def _raw_by_source_fingerprint(product_type: str, source: str) -> Tuple[Tuple[str, int], ...]:
+    """Fingerprint for /raw/<type>/<source>, answering 404 when no scrape file is from that source"""
+    fingerprint = _checked_fingerprint(product_type, "raw", raw_source=source)
+    if not fingerprint:
+        raise NotFound(f"No raw data found for {product_type} from source: {source}")
+    return fingerprint
+
+def _directory_fingerprint(product_type: str, directory: str) -> Tuple[Tuple[str, int], ...]:
+    """Fingerprint for the per-type brochure/image listings, rejecting unknown types"""
+    if product_type not in PRODUCT_TYPES:
+        raise BadRequest(f"Invalid product type. Must be one of: {PRODUCT_TYPES}")
+    return _data_fingerprint([], [], (directory,))
+
+def _search_fingerprint() -> Tuple[Tuple[str, int], ...]:
+    """Fingerprint for /search, rejecting a missing/short query or bad paging before the view"""
+    query = request.args.get('q', '').strip()
+    if not query:
+        raise BadRequest("Query parameter 'q' is required")
+    if len(query) < 2:
+        raise BadRequest("Query must be at least 2 characters long")
+    _paging_args(default_limit=50)
+    
+    product_type = request.args.get('type')
+    return _data_fingerprint([product_type] if product_type in PRODUCT_TYPES else PRODUCT_TYPES,
+                             [request.args.get('stage', 'normalized')])
+
+def conditional_get(fingerprint_fn):
+    """Attach ETag/Last-Modified validators derived from the contributing files and answer 304 when fresh
+    
+    ``fingerprint_fn`` receives the view arguments and returns (path, mtime_ns)
+    pairs; the ETag also covers the full request path so query strings differ.
+    It must raise the view's own 400/404 for requests that would not succeed,
+    so a 304 never stands in for an error and the view only runs for a full body.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            fingerprint = fingerprint_fn(*args, **kwargs)
+            if not fingerprint:
+                return view(*args, **kwargs)
+            
+            etag = hashlib.sha1(repr((request.full_path, fingerprint)).encode("utf-8")).hexdigest()
+            last_modified = datetime.fromtimestamp(max(mtime for _, mtime in fingerprint) / 1e9, tz=timezone.utc).replace(microsecond=0)
+            
+            if request.if_none_match:
+                # Flask-Compress suffixes the ETag of compressed bodies with ":<algorithm>"
+                candidates = [etag] + [f"{etag}:{algorithm}" for algorithm in app.config["COMPRESS_ALGORITHM"]]
+                not_modified = any(request.if_none_match.contains(candidate) for candidate in candidates)
+            else:
+                not_modified = request.if_modified_since is not None and last_modified <= request.if_modified_since
+            
+            response = Response(status=304) if not_modified else make_response(view(*args, **kwargs))
+            if response.status_code in (200, 304):
+                response.set_etag(etag)
+                response.last_modified = last_modified
+            return response
+        return wrapper
+    return decorator
+
+# === Pagination and Projection ===
+def _paging_args(default_limit: Optional[int] = None) -> Tuple[int, Optional[int]]:
+    """Read ?offset= and ?limit= from the request; limit None means no limit"""
+    try:
+        offset = int(request.args.get('offset', 0))
+        limit = request.args.get('limit')
+        limit = int(limit) if limit is not None else default_limit
+    except ValueError:
+        raise BadRequest("Parameters 'offset' and 'limit' must be integers")
+    
+    if offset < 0 or (limit is not None and limit < 0):
+        raise BadRequest("Parameters 'offset' and 'limit' must not be negative")
+    return offset, limit
+
+def _field_paths() -> List[Tuple[str, ...]]:
+    """Parse ?fields=name,price,specs.battery into key paths"""
+    fields = request.args.get('fields', '')
+    return [tuple(field.split('.')) for field in fields.split(',') if field.strip()]
+
+def project_fields(obj: Any, paths: List[Tuple[str, ...]]) -> Any:
+    """Keep only the given (possibly nested) key paths of a dict; missing keys are skipped"""
+    if not paths or not isinstance(obj, dict):
+        return obj
+    
+    projected: Dict[str, Any] = {}
+    # Deeper paths first, so a shorter overlapping path replaces the fresh dicts built for them
+    # instead of nested keys being written into the shared loaded data
+    for path in sorted(paths, key=len, reverse=True):
+        value = obj
+        for key in path:
+            if not isinstance(value, dict) or key not in value:
+                break
+            value = value[key]
+        else:
+            target = projected
+            for key in path[:-1]:
+                target = target.setdefault(key, {})
+            target[path[-1]] = value
+    return projected
+
+def paginate_items(data: Dict[str, Any], offset: int, limit: Optional[int]) -> Dict[str, Any]:
+    """Slice a dict's entries in order without copying the entries outside the page"""
+    end = None if limit is None else offset + limit
+    return dict(itertools.islice(data.items(), offset, end))
+
 # === API Endpoints ===
 
 @app.route("/", methods=["GET"])
@@ -194,61 +761,18 @@ def health_check():
     })
 
 @app.route("/products", methods=["GET"])
+@conditional_get(lambda: _data_fingerprint(PRODUCT_TYPES, list(DATA_STAGES), (IMAGES_DIR, BROCHURES_DIR)))
 def list_products():
     """List all available product types with data availability across all stages"""
-    products_info = {}
-    
-    for product_type in PRODUCT_TYPES:
-        type_info = {
-            "available_stages": {},
-            "total_stages_available": 0,
-            "latest_date": None,
-            "image_count": len(get_product_images(product_type)),
-            "brochure_count": len(get_available_brochures(product_type))
-        }
-        
-        # Check each data stage
-        for stage in DATA_STAGES.keys():
-            try:
-                data = load_product_data(product_type, stage)
-                if stage == "internal":
-                    count = len(data.get("internal_data", []))
-                    dates = ["internal"]
-                elif stage == "raw":
-                    count = len(data)
-                    dates = list(data.keys())
-                else:
-                    count = len(data)
-                    dates = list(data.keys()) if isinstance(data, dict) else []
-                
-                type_info["available_stages"][stage] = {
-                    "available": True,
-                    "count": count,
-                    "dates": dates
-                }
-                type_info["total_stages_available"] += 1
-                
-                # Get latest date from normalized stage if available
-                if stage == "normalized" and dates:
-                    type_info["latest_date"] = max(dates)
-                    
-            except (FileNotFoundError, ValueError):
-                type_info["available_stages"][stage] = {
-                    "available": False,
-                    "count": 0,
-                    "dates": []
-                }
-        
-        products_info[product_type] = type_info
-    
     return jsonify({
-        "products": products_info,
+        "products": get_products_snapshot(),
         "total_types": len(PRODUCT_TYPES),
         "available_stages": list(DATA_STAGES.keys()),
         "timestamp": datetime.now().isoformat()
     })
 
 @app.route("/products/<product_type>", methods=["GET"])
+@conditional_get(_products_by_type_fingerprint)
 def get_products_by_type(product_type: str):
     """Get all products of a specific type"""
     try:
@@ -266,18 +790,35 @@ def get_products_by_type(product_type: str):
             if isinstance(data, dict):
                 data = {date_filter: data[date_filter]}
         
-        # Add image information if requested
+        # Page and project before anything is copied or serialized
+        offset, limit = _paging_args()
+        fields = _field_paths()
+        if stage == "internal":
+            records = data.get("internal_data", [])
+            total = len(records)
+            end = None if limit is None else offset + limit
+            data = {"internal_data": [project_fields(record, fields) for record in records[offset:end]]}
+        elif isinstance(data, dict):
+            total = len(data)
+            data = {date: project_fields(entry, fields) for date, entry in paginate_items(data, offset, limit).items()}
+        else:
+            total = 1
+        
+        # Add image information if requested (copy entries, the loaded data is shared)
         if include_images and stage != "internal":
             if isinstance(data, dict):
-                for date in data.keys():
-                    images = get_product_images(product_type, date)
-                    if isinstance(data[date], dict):
-                        data[date]["_images"] = images
+                data = {
+                    date: {**entry, "_images": get_product_images(product_type, date)} if isinstance(entry, dict) else entry
+                    for date, entry in data.items()
+                }
         
         return jsonify({
             "product_type": product_type,
             "stage": stage,
             "count": len(data) if isinstance(data, dict) else 1,
+            "total": total,
+            "offset": offset,
+            "limit": limit,
             "data": data,
             "timestamp": datetime.now().isoformat()
         })
@@ -288,6 +829,7 @@ def get_products_by_type(product_type: str):
         raise NotFound(str(e))
 
 @app.route("/products/<product_type>/<date>", methods=["GET"])
+@conditional_get(_product_by_date_fingerprint)
 def get_product_by_date(product_type: str, date: str):
     """Get specific product by type and date"""
     try:
@@ -303,7 +845,7 @@ def get_product_by_date(product_type: str, date: str):
         
         if include_images:
             images = get_product_images(product_type, date)
-            product["_images"] = images
+            product = {**product, "_images": images}
         
         return jsonify({
             "product_type": product_type,
@@ -318,24 +860,21 @@ def get_product_by_date(product_type: str, date: str):
         raise NotFound(str(e))
 
 @app.route("/products/<product_type>/latest", methods=["GET"])
+@conditional_get(_latest_product_fingerprint)
 def get_latest_product(product_type: str):
     """Get latest product of a specific type"""
     try:
-        data = load_product_data(product_type)
+        latest_date, product = get_latest_entry(product_type)
         
-        if not data:
+        if latest_date is None:
             raise NotFound(f"No products found for type: {product_type}")
         
-        # Get the latest date
-        latest_date = max(data.keys())
-        product = data[latest_date]
-        
         # Optional query parameters
         include_images = request.args.get('include_images', 'false').lower() == 'true'
         
         if include_images:
             images = get_product_images(product_type, latest_date)
-            product["_images"] = images
+            product = {**product, "_images": images}
         
         return jsonify({
             "product_type": product_type,
@@ -351,30 +890,23 @@ def get_latest_product(product_type: str):
         raise NotFound(str(e))
 
 @app.route("/raw/<product_type>", methods=["GET"])
+@conditional_get(_raw_fingerprint)
 def get_raw_data(product_type: str):
     """Get raw scraped data for a product type"""
     try:
-        data = load_product_data(product_type, "raw")
-        
         # Query parameters
         source_filter = request.args.get('source')  # amazon, flipkart
         date_filter = request.args.get('date')
         
-        # Filter by source or date if specified
-        filtered_data = {}
-        for datetime_key, sources in data.items():
-            date_part = datetime_key.split('_')[0]
-            
-            # Date filter
-            if date_filter and date_part != date_filter:
-                continue
-            
-            # Source filter
-            if source_filter:
-                if source_filter in sources:
-                    filtered_data[datetime_key] = {source_filter: sources[source_filter]}
-            else:
-                filtered_data[datetime_key] = sources
+        # Date and source filters are applied to filenames before any file is parsed
+        data = load_product_data(product_type, "raw", raw_date=date_filter, raw_source=source_filter)
+        
+        offset, limit = _paging_args()
+        fields = _field_paths()
+        filtered_data = {
+            datetime_key: {source: project_fields(payload, fields) for source, payload in sources.items()}
+            for datetime_key, sources in paginate_items(data, offset, limit).items()
+        }
         
         return jsonify({
             "product_type": product_type,
@@ -382,6 +914,9 @@ def get_raw_data(product_type: str):
             "source_filter": source_filter,
             "date_filter": date_filter,
             "count": len(filtered_data),
+            "total": len(data),
+            "offset": offset,
+            "limit": limit,
             "data": filtered_data,
             "timestamp": datetime.now().isoformat()
         })
@@ -392,12 +927,13 @@ def get_raw_data(product_type: str):
         raise NotFound(str(e))
 
 @app.route("/raw/<product_type>/<source>", methods=["GET"])
+@conditional_get(_raw_by_source_fingerprint)
 def get_raw_data_by_source(product_type: str, source: str):
     """Get raw data by product type and specific source"""
     try:
-        data = load_product_data(product_type, "raw")
+        data = load_product_data(product_type, "raw", raw_source=source)
         
-        # Filter by source
+        # Only this source's files were loaded; unwrap one level
         source_data = {}
         for datetime_key, sources in data.items():
             if source in sources:
@@ -421,6 +957,7 @@ def get_raw_data_by_source(product_type: str, source: str):
         raise NotFound(str(e))
 
 @app.route("/internal/<product_type>", methods=["GET"])
+@conditional_get(lambda product_type: _checked_fingerprint(product_type, "internal"))
 def get_internal_data(product_type: str):
     """Get internal CSV data for a product type"""
     try:
@@ -440,6 +977,7 @@ def get_internal_data(product_type: str):
         raise NotFound(str(e))
 
 @app.route("/brochures", methods=["GET"])
+@conditional_get(lambda: _data_fingerprint([], [], (BROCHURES_DIR,)))
 def get_all_brochures():
     """Get all available PDF brochures"""
     brochures = get_available_brochures()
@@ -463,6 +1001,7 @@ def get_all_brochures():
     })
 
 @app.route("/brochures/<product_type>", methods=["GET"])
+@conditional_get(lambda product_type: _directory_fingerprint(product_type, BROCHURES_DIR))
 def get_brochures_by_type(product_type: str):
     """Get PDF brochures for a specific product type"""
     if product_type not in PRODUCT_TYPES:
@@ -479,6 +1018,7 @@ def get_brochures_by_type(product_type: str):
     })
 
 @app.route("/images/<product_type>", methods=["GET"])
+@conditional_get(lambda product_type: _directory_fingerprint(product_type, IMAGES_DIR))
 def get_images_by_type(product_type: str):
     """Get available images for a product type"""
     if product_type not in PRODUCT_TYPES:
@@ -489,19 +1029,7 @@ def get_images_by_type(product_type: str):
     date_filter = request.args.get('date')
     
     images = get_product_images(product_type, date_filter, source_filter)
-    
-    # Group images by source and date
-    images_info = {}
-    for image in images:
-        parts = image.split('_')
-        if len(parts) >= 4:
-            img_source = parts[1]
-            img_date = parts[2]
-            
-            key = f"{img_source}_{img_date}"
-            if key not in images_info:
-                images_info[key] = []
-            images_info[key].append(image)
+    images_info = get_images_by_source_date(product_type, date_filter, source_filter)
     
     return jsonify({
         "product_type": product_type,
@@ -514,6 +1042,7 @@ def get_images_by_type(product_type: str):
     })
 
 @app.route("/search", methods=["GET"])
+@conditional_get(_search_fingerprint)
 def search_products():
     """Search across all product data"""
     query = request.args.get('q', '').strip()
@@ -526,50 +1055,47 @@ def search_products():
     if len(query) < 2:
         raise BadRequest("Query must be at least 2 characters long")
     
-    results = []
+    offset, limit = _paging_args(default_limit=50)
+    fields = _field_paths()
+    
+    matches = []
     search_types = [product_type_filter] if product_type_filter in PRODUCT_TYPES else PRODUCT_TYPES
     
+    query_lower = query.lower()
     for product_type in search_types:
         try:
-            data = load_product_data(product_type, stage_filter)
-            
-            if stage_filter == "internal":
-                products = data.get("internal_data", [])
-            elif isinstance(data, dict):
-                products = []
-                for date_key, date_data in data.items():
-                    if isinstance(date_data, list):
-                        products.extend(date_data)
-                    else:
-                        products.append(date_data)
-            else:
-                products = [data]
-            
-            # Search within products
-            for product in products:
-                if isinstance(product, dict):
-                    # Convert product to searchable text
-                    searchable_text = json.dumps(product, default=str).lower()
-                    if query.lower() in searchable_text:
-                        results.append({
-                            "product_type": product_type,
-                            "stage": stage_filter,
-                            "product": product,
-                            "relevance": searchable_text.count(query.lower())
-                        })
+            # Candidates already contain the query; only relevance is left to compute
+            for product, searchable_text in find_searchable_products(product_type, stage_filter, query_lower):
+                matches.append((searchable_text.count(query_lower), product_type, product))
         
         except (FileNotFoundError, ValueError):
             continue
     
-    # Sort by relevance
-    results.sort(key=lambda x: x["relevance"], reverse=True)
+    # Select only the requested page by relevance (nlargest keeps the stable sort order)
+    relevance = lambda match: match[0]
+    if limit is None:
+        ranked = sorted(matches, key=relevance, reverse=True)[offset:]
+    else:
+        ranked = heapq.nlargest(offset + limit, matches, key=relevance)[offset:]
+    
+    results = [
+        {
+            "product_type": product_type,
+            "stage": stage_filter,
+            "product": project_fields(product, fields),
+            "relevance": score
+        }
+        for score, product_type, product in ranked
+    ]
     
     return jsonify({
         "query": query,
         "product_type_filter": product_type_filter,
         "stage_filter": stage_filter,
-        "total_results": len(results),
-        "results": results[:50],  # Limit to 50 results
+        "total_results": len(matches),
+        "offset": offset,
+        "limit": limit,
+        "results": results,
         "timestamp": datetime.now().isoformat()
     })
 
@@ -577,7 +1103,7 @@ def search_products():
 def download_brochure(filename: str):
     """Download a specific PDF brochure"""
     try:
-        return send_from_directory(BROCHURES_DIR, filename, as_attachment=True)
+        return send_file_from(BROCHURES_DIR, "brochures", filename, as_attachment=True)
     except FileNotFoundError:
         raise NotFound(f"Brochure file not found: {filename}")
 
@@ -628,8 +1154,8 @@ def web_api_docs():
 @app.route("/favicon.ico")
 def favicon():
     """Serve favicon"""
-    return send_from_directory(os.path.join(app.root_path, 'static'),
-                              'favicon.ico', mimetype='image/vnd.microsoft.icon')
+    return send_file_from(os.path.join(app.root_path, 'static'), "static",
+                          'favicon.ico', mimetype='image/vnd.microsoft.icon')
 
 # === Error Handlers ===
 
@@ -657,6 +1183,13 @@ def internal_error(error):
         "timestamp": datetime.now().isoformat()
     }), 500
 
+# === Startup ===
+# WSGI servers import this module without running __main__; WARM_CACHES=1 warms each worker on import
+if os.getenv("WARM_CACHES") == "1" and __name__ != "__main__":
+    warm_caches()
+    if os.getenv("CACHE_REFRESH_INTERVAL"):
+        start_cache_refresher(float(os.getenv("CACHE_REFRESH_INTERVAL")))
+
 # === Main ===
 if __name__ == "__main__":
     # Ensure required directories exist
@@ -670,7 +1203,7 @@ if __name__ == "__main__":
     print("\nAvailable data files:")
     
     for product_type in PRODUCT_TYPES:
-        file_path = os.path.join(NORMALIZED_DATA_DIR, f"{product_type}_llm_normalized.json")
+        file_path = FILE_PATHS[(product_type, "normalized")]
         exists = "✓" if os.path.exists(file_path) else "✗"
         print(f"  {exists} {product_type}_llm_normalized.json")
     
@@ -686,6 +1219,14 @@ if __name__ == "__main__":
     print("  GET /products/{type}/latest - Get latest product")
     print("  GET /search?q={query} - Search products")
     
-    app.run(debug=True, host="0.0.0.0", port=5000)
+    print("\nWarming data caches...")
+    warm_caches()
+    if os.getenv("CACHE_REFRESH_INTERVAL"):
+        start_cache_refresher(float(os.getenv("CACHE_REFRESH_INTERVAL")))
+    
+    print("\nFor concurrent serving use gunicorn with gevent workers:")
+    print("  gunicorn -k gevent -w 4 --worker-connections 1000 app:app")
     
-    app.run(debug=True, host="0.0.0.0", port=5000)
+    # The debugger and reloader double startup cost and memory; opt in with FLASK_DEBUG=1
+    debug = os.getenv("FLASK_DEBUG") == "1"
+    app.run(debug=debug, host="0.0.0.0", port=5000)
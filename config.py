@@ -60,7 +60,7 @@ PRODUCT_TYPES = {
 API_CONFIG = {
     "host": "0.0.0.0",
     "port": 5000,
-    "debug": True
+    "debug": os.getenv("FLASK_DEBUG") == "1"
 }
 
 # Load environment variables
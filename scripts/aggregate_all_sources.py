@@ -4,8 +4,10 @@ Aggregate data from multiple sources: scraped e-commerce data + internal CSV dat
 This feeds into the LLM normalization layer with enriched data.
 """
 
-import json
 import os
+import orjson
+from argparse import ArgumentParser
+from functools import lru_cache
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
@@ -21,6 +23,9 @@ csv_data_dir = os.path.join(project_root, "data")
 aggregated_output_dir = os.path.join(project_root, "aggregated_output")
 output_file = os.path.join(aggregated_output_dir, f"{product_type}_aggregated.json")
 
+# Sources recorded in each aggregated record's metadata
+AGGREGATION_SOURCES = ("amazon", "flipkart", "internal_csv")
+
 # === CSV DATA LOADER ===
 def load_internal_csv_data(product_type: str):
     """Load internal CSV data for the specified product type"""
@@ -42,72 +47,116 @@ def load_internal_csv_data(product_type: str):
     
     print(f"[✓] Loading internal CSV data from: {csv_file}")
     
-    df = pd.read_csv(csv_path)
+    # Read only the needed columns, all as strings
+    df = pd.read_csv(csv_path, usecols=["Attribute", "Variant", "Value"], dtype=str)
+    
+    # Normalize whole columns at once and drop rows without a value. Missing cells become
+    # "nan" explicitly, matching str(value) on the NaN pandas reads for an empty cell.
+    def as_str(column):
+        return column.fillna("nan")
+    
+    frame = pd.DataFrame({
+        "attr": as_str(df["Attribute"]).str.lower().str.replace(" ", "_", regex=False),
+        "variant": as_str(df["Variant"]),
+        "value": as_str(df["Value"])
+    })
+    frame = frame[frame["value"] != "nan"].reset_index(drop=True)
+    is_all = frame["variant"].isin(["All", "nan"])
+    
+    # An "All" row replaces whatever the attribute held before it, so only variant rows
+    # after the attribute's last "All" row survive (later duplicates of a variant win)
+    position = pd.Series(frame.index, index=frame.index)
+    last_all = position.where(is_all).groupby(frame["attr"]).transform("max")
+    variant_rows = frame[~is_all & ~(position <= last_all)]
+    variant_values = variant_rows.groupby(["attr", "variant"], sort=False)["value"].last()
+    all_values = frame[is_all].groupby("attr", sort=False)["value"].last()
+    
+    variant_dicts = {}
+    for (attr, variant), value in variant_values.items():
+        variant_dicts.setdefault(attr, {})[variant] = value
+    
+    # Attributes keep first-appearance order; single-variant attributes are flattened
     internal_data = {}
-    
-    for _, row in df.iterrows():
-        attribute = str(row["Attribute"]).lower().replace(" ", "_")
-        variant = str(row["Variant"])
-        value = str(row["Value"])
-        
-        # Skip empty or NaN values
-        if pd.isna(value) or value == "nan":
-            continue
-            
-        # Group by attribute, handling multiple variants
-        if attribute not in internal_data:
-            internal_data[attribute] = {}
-        
-        if variant == "All" or variant == "nan":
-            internal_data[attribute] = value
-        else:
-            if not isinstance(internal_data[attribute], dict):
-                internal_data[attribute] = {}
-            internal_data[attribute][variant] = value
-    
-    # Flatten single-variant attributes
-    flattened = {}
-    for attr, value in internal_data.items():
-        if isinstance(value, dict) and len(value) == 1:
-            flattened[attr] = list(value.values())[0]
+    for attr in frame["attr"].unique():
+        variants = variant_dicts.get(attr)
+        if not variants:
+            internal_data[attr] = all_values[attr]
+        elif len(variants) == 1:
+            internal_data[attr] = next(iter(variants.values()))
         else:
-            flattened[attr] = value
+            internal_data[attr] = variants
     
-    return flattened
+    return internal_data
 
 # === AGGREGATION LOGIC ===
-def aggregate_sources(scraped_data: dict, internal_data: dict):
-    """Merge scraped e-commerce data with internal CSV data"""
-    
-    # Start with scraped data as base
-    aggregated = scraped_data.copy()
+@lru_cache(maxsize=None)
+def normalize_attribute_key(key: str) -> str:
+    """Normalize an attribute name for matching (memoized, the same keys recur on every date)"""
+    return key.lower().replace(" ", "_").replace("-", "_")
+
+def prepare_internal_data(internal_data: dict):
+    """Normalize internal keys once and rank how detailed each value is
+    
+    Returns (norm_key, internal_key, verified_key, value, detail) tuples; an internal
+    value is preferred over a scraped one when ``detail`` exceeds the scraped value's
+    string length. Output key names are built here once rather than on every date.
+    """
+    prepared = []
+    for key, value in internal_data.items():
+        norm_key = normalize_attribute_key(key)
+        if isinstance(value, dict):
+            detail = float("inf")
+        elif isinstance(value, str):
+            detail = len(value)
+        else:
+            detail = -1
+        prepared.append((norm_key, f"{norm_key}_internal", f"{norm_key}_verified", value, detail))
+    return prepared
+
+def aggregate_sources(scraped_data: dict, internal_items: list, norm_cache: dict = None):
+    """Merge prepared internal CSV data into scraped e-commerce data in place
+    
+    ``norm_cache`` maps a tuple of scraped keys to its normalized-key map, so dates
+    sharing the same scraped schema build that map only once.
+    """
+    
+    # Scraped data is the base; it is extended directly rather than copied
+    aggregated = scraped_data
+    
+    # Normalized key -> first aggregated key with that normalization
+    schema = tuple(aggregated)
+    scraped_norm = norm_cache.get(schema) if norm_cache is not None else None
+    if scraped_norm is None:
+        scraped_norm = {}
+        for k in schema:
+            scraped_norm.setdefault(normalize_attribute_key(k), k)
+        if norm_cache is not None:
+            norm_cache[schema] = scraped_norm
+    # Copy, since keys added below are recorded in this map
+    aggregated_norm = scraped_norm.copy()
     
     # Add internal data, with preference for internal data when conflicts arise
-    for key, value in internal_data.items():
-        # Normalize key for comparison
-        norm_key = key.lower().replace(" ", "_").replace("-", "_")
-        
+    for norm_key, internal_key, verified_key, value, detail in internal_items:
         # Check if we already have this data from scraping
-        existing_keys = [k for k in aggregated.keys() if k.lower().replace(" ", "_").replace("-", "_") == norm_key]
+        existing_key = aggregated_norm.get(norm_key)
         
-        if existing_keys:
-            # We have this attribute from scraping, let's merge intelligently
-            existing_key = existing_keys[0]
-            existing_value = aggregated[existing_key]
-            
-            # If internal data is more detailed, prefer it
-            if isinstance(value, dict) or (isinstance(value, str) and len(value) > len(str(existing_value))):
-                aggregated[f"{norm_key}_internal"] = value
-            else:
-                aggregated[f"{norm_key}_verified"] = value
-        else:
+        if existing_key is None:
             # New attribute from internal data
-            aggregated[f"{norm_key}_internal"] = value
+            new_key = internal_key
+        elif detail > len(str(aggregated[existing_key])):
+            # Internal data is more detailed, prefer it
+            new_key = internal_key
+        else:
+            new_key = verified_key
+        
+        aggregated[new_key] = value
+        # Added keys are already normalized and can match later internal attributes
+        aggregated_norm.setdefault(new_key, new_key)
     
     return aggregated
 
 # === MAIN WORKFLOW ===
-def main():
+def main(pretty: bool = False):
     # Create output directory
     os.makedirs(aggregated_output_dir, exist_ok=True)
     
@@ -117,8 +166,8 @@ def main():
         print(f"[!] Combined scraped data not found: {combined_file}")
         return
     
-    with open(combined_file, "r", encoding="utf-8") as f:
-        scraped_data = json.load(f)
+    with open(combined_file, "rb") as f:
+        scraped_data = orjson.loads(f.read())
     
     print(f"[✓] Loaded scraped data with {len(scraped_data)} date entries")
     
@@ -126,36 +175,55 @@ def main():
     internal_data = load_internal_csv_data(product_type)
     print(f"[✓] Loaded internal data with {len(internal_data)} attributes")
     
-    # Aggregate all sources
-    final_aggregated = {}
-    
-    for date, product_data in scraped_data.items():
-        print(f"→ Aggregating data for date: {date}")
-        
-        # Merge scraped data with internal data
-        aggregated_product = aggregate_sources(product_data, internal_data)
-        
-        # Add metadata
-        aggregated_product["_metadata"] = {
-            "scraped_fields": len(product_data),
-            "internal_fields": len(internal_data),
-            "total_fields": len(aggregated_product) - 1,  # -1 for metadata itself
-            "aggregation_date": datetime.now().isoformat(),
-            "sources": ["amazon", "flipkart", "internal_csv"]
-        }
-        
-        final_aggregated[date] = aggregated_product
+    # Aggregate all sources, writing each date to disk as soon as it is merged so only
+    # one day's aggregate is held in memory. The object is assembled from per-date
+    # orjson chunks, which produces the same bytes as dumping the whole dict at once.
+    # Output is compact unless pretty=True (2-space indent, for reading by hand).
+    dump_option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+    # Pretty chunks end in "\n}", compact ones in "}"
+    chunk_end = -2 if pretty else -1
+    internal_items = prepare_internal_data(internal_data)
+    internal_fields = len(internal_data)
+    norm_cache = {}
+    # One timestamp for the whole run
+    aggregation_date = datetime.now().isoformat()
+    summaries = []
+    tmp_file = output_file + ".tmp"
+    
+    with open(tmp_file, "wb") as f:
+        f.write(b"{")
+        for index, (date, product_data) in enumerate(scraped_data.items()):
+            print(f"→ Aggregating data for date: {date}")
+            
+            # Merge scraped data with internal data (count scraped fields first, the merge is in place)
+            scraped_fields = len(product_data)
+            aggregated_product = aggregate_sources(product_data, internal_items, norm_cache)
+            
+            # Add metadata
+            aggregated_product["_metadata"] = {
+                "scraped_fields": scraped_fields,
+                "internal_fields": internal_fields,
+                "total_fields": len(aggregated_product) - 1,  # -1 for metadata itself
+                "aggregation_date": aggregation_date,
+                "sources": AGGREGATION_SOURCES
+            }
+            
+            # Drop the enclosing braces so the entry nests inside the output object
+            chunk = orjson.dumps({date: aggregated_product}, option=dump_option)
+            f.write((b"," if index else b"") + chunk[1:chunk_end])
+            summaries.append((date, aggregated_product["_metadata"]))
+        f.write(b"\n}" if pretty and summaries else b"}")
     
-    # Save aggregated data
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(final_aggregated, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_file, output_file)
     
     print(f"\n[✓] Aggregated data saved to: {output_file}")
     
     # Print summary
-    for date, data in final_aggregated.items():
-        metadata = data.get("_metadata", {})
+    for date, metadata in summaries:
         print(f"Date {date}: {metadata.get('scraped_fields', 0)} scraped + {metadata.get('internal_fields', 0)} internal = {metadata.get('total_fields', 0)} total fields")
 
 if __name__ == "__main__":
-    main()
+    parser = ArgumentParser(description="Aggregate scraped and internal product data")
+    parser.add_argument("--pretty", action="store_true", help="Indent the aggregated JSON output")
+    args = parser.parse_args()
+    main(pretty=args.pretty)
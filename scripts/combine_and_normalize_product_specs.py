@@ -1,8 +1,11 @@
-import json
 import re
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from glob import glob
 
+import orjson
+
 # === CONFIG ===
 # Get the project root directory (parent of scripts folder)
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -51,25 +54,36 @@ normalization_map = {
     "audio_jack": ["audio_jack", "headphone_jack", "audio_port"]
 }
 
+# Reverse lookup of variant/standard name -> standard name (first match in map order wins)
+REVERSE_MAP = {}
+for std, variants in normalization_map.items():
+    for name in [*variants, std]:
+        REVERSE_MAP.setdefault(name, std)
+
 # === Helper functions ===
 
+@lru_cache(maxsize=4096)
 def normalize_key(label):
     return label.lower().strip().replace(" ", "_")
 
 def match_normalized_key(label):
     norm_label = normalize_key(label)
-    for std, variants in normalization_map.items():
-        if norm_label in variants or norm_label == std:
-            return std
-    return norm_label
+    return REVERSE_MAP.get(norm_label, norm_label)
+
+# Date part (YYYYMMDD) of filenames like phones_amazon_20250601_050408.json
+_DATE_RE = re.compile(rf"{product_type}_\w+_(\d{{8}})_\d{{6}}\.json")
 
 def extract_date(file_path):
     """Extract date from filename like phones_amazon_20250601_050408.json"""
-    basename = os.path.basename(file_path)
-    # Extract date part (YYYYMMDD) from the filename
-    match = re.search(rf"{product_type}_\w+_(\d{{8}})_\d{{6}}\.json", basename)
+    match = _DATE_RE.search(os.path.basename(file_path))
     return match.group(1) if match else None
 
+def load_pair(pair):
+    """Read and parse one Amazon/Flipkart file pair"""
+    date, amazon_path, flipkart_path = pair
+    with open(amazon_path, "rb") as f1, open(flipkart_path, "rb") as f2:
+        return date, orjson.loads(f1.read()), orjson.loads(f2.read())
+
 # === Main combine logic ===
 
 # Create output directory if it doesn't exist
@@ -83,7 +97,15 @@ flipkart_files = glob(os.path.join(input_dir, f"{product_type}_flipkart_*.json")
 
 print(f"Found {len(amazon_files)} Amazon files and {len(flipkart_files)} Flipkart files")
 
-# Pair and merge files based on date
+# Index Flipkart files by date once; the first file per date is used, as before
+flipkart_by_date = {}
+for flipkart_file in flipkart_files:
+    flipkart_date = extract_date(flipkart_file)
+    if flipkart_date:
+        flipkart_by_date.setdefault(flipkart_date, flipkart_file)
+
+# Pair files based on date
+pairs = []
 for amazon_path in amazon_files:
     date = extract_date(amazon_path)
     if not date:
@@ -91,36 +113,44 @@ for amazon_path in amazon_files:
         continue
     
     # Find corresponding Flipkart file with same date
-    flipkart_candidates = [f for f in flipkart_files if extract_date(f) == date]
-    if not flipkart_candidates:
+    flipkart_path = flipkart_by_date.get(date)
+    if not flipkart_path:
         print(f"No matching Flipkart file found for date {date}")
         continue
-    
-    flipkart_path = flipkart_candidates[0]  # Take the first match
 
     print(f"Processing pair: {os.path.basename(amazon_path)} + {os.path.basename(flipkart_path)}")
+    pairs.append((date, amazon_path, flipkart_path))
 
-    with open(amazon_path, "r", encoding="utf-8") as f1, open(flipkart_path, "r", encoding="utf-8") as f2:
-        amazon_data = json.load(f1)
-        flipkart_data = json.load(f2)
+# Read pairs concurrently (file I/O overlaps with parsing), then merge in the original order
+with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2)) as executor:
+    loaded_pairs = list(executor.map(load_pair, pairs))
 
+for date, amazon_data, flipkart_data in loaded_pairs:
     # Merge based on normalized keys
     merged = {}
+    # String values already in each multi-valued field, for O(1) duplicate checks
+    merged_seen = {}
     for item in amazon_data + flipkart_data:
         key = match_normalized_key(item["label"])
         value = item["value"]
         if key not in merged:
             merged[key] = value
         elif isinstance(merged[key], list):
-            if value not in merged[key]:
+            if isinstance(value, str):
+                if key not in merged_seen:
+                    merged_seen[key] = {v for v in merged[key] if isinstance(v, str)}
+                if value not in merged_seen[key]:
+                    merged_seen[key].add(value)
+                    merged[key].append(value)
+            elif value not in merged[key]:
                 merged[key].append(value)
         elif merged[key] != value:
             merged[key] = [merged[key], value]
 
     combined[date] = merged
 
-# Write output
-with open(output_file, "w", encoding="utf-8") as f:
-    json.dump(combined, f, indent=2, ensure_ascii=False)
+# Write output (orjson emits UTF-8 bytes without escaping non-ASCII)
+with open(output_file, "wb") as f:
+    f.write(orjson.dumps(combined, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
 print(f"[✓] Combined and normalized {len(combined)} products into {output_file}")
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Write a MessagePack copy of each normalized JSON file so the API can load
+product data without re-parsing JSON text.
+"""
+
+import os
+import json
+import msgpack
+
+# === CONFIG ===
+# Get the project root directory (parent of scripts folder)
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+normalized_dir = os.path.join(project_root, "normalized_output")
+
+PRODUCT_TYPES = ["phones", "tv", "watch"]
+
+def convert(json_file: str, msgpack_file: str) -> None:
+    """Write the contents of a JSON file to a MessagePack file next to it"""
+    with open(json_file, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    # Write to a temporary file first so the API never reads a half-written sidecar
+    tmp_file = msgpack_file + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(msgpack.packb(data, use_bin_type=True))
+    os.replace(tmp_file, msgpack_file)
+
+def main():
+    for product_type in PRODUCT_TYPES:
+        json_file = os.path.join(normalized_dir, f"{product_type}_llm_normalized.json")
+        if not os.path.exists(json_file):
+            print(f"[!] Skipping {product_type}: {json_file} not found")
+            continue
+
+        msgpack_file = os.path.splitext(json_file)[0] + ".msgpack"
+        convert(json_file, msgpack_file)
+        print(f"[✓] {os.path.basename(json_file)} → {os.path.basename(msgpack_file)} "
+              f"({os.path.getsize(json_file):,} → {os.path.getsize(msgpack_file):,} bytes)")
+
+if __name__ == "__main__":
+    main()
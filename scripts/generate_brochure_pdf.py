@@ -1,8 +1,15 @@
-import json
+import orjson
 import os
 import re
-import glob
+import heapq
+from functools import lru_cache
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
 from fpdf import FPDF
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
 from datetime import datetime
 
 # === CONFIG ===
@@ -14,27 +21,76 @@ product_type = "tv"   # can be 'phones', 'watch', or 'tv'
 input_file = os.path.join(project_root, "normalized_output", f"{product_type}_llm_normalized.json")
 output_dir = os.path.join(project_root, "brochures")
 images_dir = os.path.join(project_root, "images")
+THUMBNAIL_SIZE = (320, 240)  # Enough pixels for the 80x60 mm image boxes
 os.makedirs(output_dir, exist_ok=True)
 
 # === IMAGE UTILITIES ===
-def find_product_images(product_type, limit=5):
-    """Find images for a specific product type"""
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.gif')
+
+def find_product_images(product_type, limit=None):
+    """Find images for a specific product type, newest first (at most ``limit`` if given)"""
+    return list(_find_product_images(product_type, limit))
+
+@lru_cache(maxsize=8)
+def _find_product_images(product_type, limit):
+    """Scan images_dir once per (product_type, limit); the directory does not change during a run"""
     if not os.path.exists(images_dir):
-        return []
+        return ()
     
     # Look for images with the new naming pattern: {product_type}_{source}_{date}_{hash}.{ext}
-    pattern = os.path.join(images_dir, f"{product_type}_*.*")
-    all_images = glob.glob(pattern)
+    # A single scandir pass reads names and mtimes without a separate stat per glob match.
+    # Order by the scrape's {date}_{time} in the name first: images reused from the content store
+    # are hardlinks that keep the mtime of their first download
+    prefix = f"{product_type}_"
+    with os.scandir(images_dir) as entries:
+        valid_images = [
+            ((entry.name.split('_')[2:4], entry.stat().st_mtime), entry.path)
+            for entry in entries
+            if entry.name.startswith(prefix) and entry.name.lower().endswith(IMAGE_EXTENSIONS)
+        ]
+    
+    # Sort by scrape time, then file modification time (newest first) and limit
+    newest_first = lambda image: image[0]
+    if limit is None:
+        valid_images.sort(key=newest_first, reverse=True)
+    else:
+        valid_images = heapq.nlargest(limit, valid_images, key=newest_first)
     
-    # Filter for common image extensions
-    image_extensions = ['.jpg', '.jpeg', '.png', '.webp', '.gif']
-    valid_images = [img for img in all_images 
-                   if any(img.lower().endswith(ext) for ext in image_extensions)]
+    return tuple(path for _, path in valid_images)
+
+def pdf_image_path(image_path):
+    """Downscaled JPEG copy of an image for embedding, cached under images/.thumbs (original path without Pillow)"""
+    if Image is None:
+        return image_path
     
-    # Sort by file modification time (newest first) and limit
-    valid_images.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+    try:
+        # Key the cached copy by source name and mtime so replaced images are resized again
+        name = os.path.splitext(os.path.basename(image_path))[0]
+        thumb_name = f"{name}_{os.stat(image_path).st_mtime_ns}_{THUMBNAIL_SIZE[0]}x{THUMBNAIL_SIZE[1]}.jpg"
+        thumb_path = os.path.join(images_dir, ".thumbs", thumb_name)
+        if os.path.exists(thumb_path):
+            return thumb_path
+        
+        with Image.open(image_path) as img:
+            # For JPEGs, let the decoder scale down while decoding
+            img.draft("RGB", THUMBNAIL_SIZE)
+            if img.mode != "RGB":
+                # Flatten transparency onto white, JPEG has no alpha channel
+                rgba = img.convert("RGBA")
+                img = Image.new("RGB", rgba.size, (255, 255, 255))
+                img.paste(rgba, mask=rgba.getchannel("A"))
+            img.thumbnail(THUMBNAIL_SIZE, Image.LANCZOS)
+            
+            # Write under a per-process temporary name, brochure workers may resize the same image
+            os.makedirs(os.path.dirname(thumb_path), exist_ok=True)
+            tmp_path = f"{thumb_path}.{os.getpid()}.tmp"
+            img.save(tmp_path, "JPEG", quality=80)
+            os.replace(tmp_path, thumb_path)
+        return thumb_path
     
-    return valid_images
+    except Exception as e:
+        print(f"Warning: Could not resize image {image_path}: {e}")
+        return image_path
 
 def add_image_to_pdf(pdf, image_path, max_width=80, max_height=60):
     """Add an image to the PDF with size constraints"""
@@ -44,7 +100,7 @@ def add_image_to_pdf(pdf, image_path, max_width=80, max_height=60):
         y = pdf.get_y()
         
         # Add image with size constraints
-        pdf.image(image_path, x=x, y=y, w=max_width, h=max_height)
+        pdf.image(pdf_image_path(image_path), x=x, y=y, w=max_width, h=max_height)
         
         # Move cursor below the image
         pdf.set_y(y + max_height + 5)
@@ -60,23 +116,20 @@ def add_image_grid_to_pdf(pdf, image_paths, max_width=80, max_height=60, images_
     spacing_x = 10
     spacing_y = 15
     
-    x_start = margin
-    y = pdf.get_y()
+    # Column positions and row pitch are fixed for the whole grid
+    xs = [margin + c * (max_width + spacing_x) for c in range(images_per_row)]
+    row_height = max_height + spacing_y
+    y = pdf.y
     col = 0
 
-    for i, image_path in enumerate(image_paths):
-        if col == 0:
-            x = x_start
-        else:
-            x = x_start + col * (max_width + spacing_x)
-        
+    for image_path in image_paths:
         try:
-            # Check if next row fits; if not, add a new page
-            if y + max_height + spacing_y > 270:
+            # Check if next row fits; if not, add a new page (only a new row can overflow)
+            if col == 0 and y + row_height > 270:
                 pdf.add_page()
-                y = pdf.get_y()
+                y = pdf.y
             
-            pdf.image(image_path, x=x, y=y, w=max_width, h=max_height)
+            pdf.image(pdf_image_path(image_path), x=xs[col], y=y, w=max_width, h=max_height)
         except Exception as e:
             print(f"Warning: Skipped image {image_path}: {e}")
             continue
@@ -84,50 +137,67 @@ def add_image_grid_to_pdf(pdf, image_paths, max_width=80, max_height=60, images_
         col += 1
         if col >= images_per_row:
             col = 0
-            y += max_height + spacing_y
+            y += row_height
+    
+    # Leave the cursor below the last (possibly partial) row
+    pdf.y = y + (row_height if col else 0)
 
 # === DATA FORMATTING UTILITIES ===
+class _PdfTextTable(dict):
+    """str.translate table: explicit entries cover latin-1, anything else becomes '?' (FPDF is latin-1 only)"""
+    def __missing__(self, codepoint):
+        self[codepoint] = '?'
+        return '?'
+
+# Replace problematic characters with safe alternatives
+_PDF_REPLACEMENTS = {
+    '\u2122': '(TM)', '\u00ae': '(R)', '\u00b0': ' degrees',
+    '\u2013': '-', '\u2014': '-',
+    '\u201c': '"', '\u201d': '"', '\u2018': "'", '\u2019': "'",
+    '\u2026': '...',
+    # Bullet points and similar markers
+    '\u2022': '-', '\u2023': '-', '\u25aa': '-', '\u25ab': '-'
+}
+
+# Keep latin-1 as is, apply the replacements above and drop control characters
+_PDF_TEXT_TABLE = _PdfTextTable({codepoint: codepoint for codepoint in range(256)})
+_PDF_TEXT_TABLE.update(str.maketrans(_PDF_REPLACEMENTS))
+_PDF_TEXT_TABLE.update(dict.fromkeys(
+    [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), *range(0x7F, 0x85), *range(0x86, 0xA0)]
+))
+
+class _Clean(str):
+    """Marker for text that already went through clean_text_for_pdf"""
+    __slots__ = ()
+
 def clean_text_for_pdf(text):
     """Clean text to avoid encoding issues in PDF"""
+    # format_value/format_key output is cleaned once and passed straight through at the cell call sites
+    if isinstance(text, _Clean):
+        return text
     if not isinstance(text, str):
         text = str(text)
-    
-    # Replace problematic characters with safe alternatives
-    text = text.replace('™', '(TM)')
-    text = text.replace('®', '(R)')
-    text = text.replace('°', ' degrees')
-    text = text.replace('–', '-')
-    text = text.replace('—', '-')
-    text = text.replace('"', '"')
-    text = text.replace('"', '"')
-    text = text.replace(''', "'")
-    text = text.replace(''', "'")
-    text = text.replace('…', '...')
-    
-    # Handle bullet points and special characters more carefully
-    text = text.replace('•', '-')
-    text = text.replace('‣', '-')
-    text = text.replace('▪', '-')
-    text = text.replace('▫', '-')
-    
-    # Only replace truly problematic characters, keep most Unicode
-    # Remove control characters and some problematic Unicode ranges
-    text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x84\x86-\x9F]', '', text)
-    
-    # Replace remaining problematic characters only if they cause issues
-    # Keep common Unicode characters like accented letters
-    try:
-        # Test if the text can be encoded to latin-1 (FPDF limitation)
-        text.encode('latin-1')
-    except UnicodeEncodeError:
-        # Only if encoding fails, replace problematic characters
-        text = text.encode('latin-1', errors='replace').decode('latin-1')
-    
-    return text.strip()
+    return _clean_str_for_pdf(text)
+
+@lru_cache(maxsize=4096)
+def _clean_str_for_pdf(text):
+    """Memoized cleanup; labels and headers repeat across every field and product"""
+    # One pass: replacements, control-character removal and the latin-1 fallback
+    return _Clean(text.translate(_PDF_TEXT_TABLE).strip())
+
+def _is_empty(value):
+    """Cheap structural check for values that format_value always renders as Not specified"""
+    if value is None:
+        return True
+    if isinstance(value, list):
+        return not value
+    if isinstance(value, dict):
+        return all(k.startswith('_') for k in value)
+    return False
 
 def format_value(value, key=""):
     """Format different types of values for display"""
-    if value is None:
+    if _is_empty(value):
         return "Not specified"
       # Handle boolean values
     if isinstance(value, bool):
@@ -176,6 +246,7 @@ def format_value(value, key=""):
     
     return value_str
 
+@lru_cache(maxsize=512)
 def format_key(key):
     """Format key names for display"""
     # Handle special cases
@@ -207,21 +278,23 @@ def format_key(key):
     formatted = key.replace('_', ' ').title()
     return clean_text_for_pdf(formatted)
 
+SKIP_PATTERNS = [
+    '_metadata', '_normalization', 'number_of_items', 
+    'item_height', 'item_width', 'are_batteries_included',
+    'lithium_battery_weight', 'lithium_battery_energy_content',
+    'package_dimensions', 'item_model_number', 'batteries'
+]
+# One alternation scans the key once instead of one substring test per pattern
+_SKIP_RE = re.compile('|'.join(map(re.escape, SKIP_PATTERNS)))
+
 def should_skip_field(key, value):
     """Determine if a field should be skipped in the brochure"""
-    skip_patterns = [
-        '_metadata', '_normalization', 'number_of_items', 
-        'item_height', 'item_width', 'are_batteries_included',
-        'lithium_battery_weight', 'lithium_battery_energy_content',
-        'package_dimensions', 'item_model_number', 'batteries'
-    ]
-    
     # Skip metadata and internal fields
-    if any(pattern in key for pattern in skip_patterns):
+    if _SKIP_RE.search(key):
         return True
     
     # Skip empty or meaningless values
-    if value is None or value == "" or value == "Not specified":
+    if value == "" or value == "Not specified" or _is_empty(value):
         return True
         
     # Skip very long technical strings that aren't user-friendly
@@ -231,13 +304,81 @@ def should_skip_field(key, value):
     return False
 
 # === ENHANCED PDF CLASS ===
+MAX_FEATURES = 12  # Feature grid shows at most this many
+
+# Core font entries every brochure uses, in the order a brochure first selects them
+BROCHURE_FONT_STYLES = ("B", "", "I")
+
+def _build_prototype_fonts():
+    """Register the brochure fonts once so each new PDF starts with them already resolved"""
+    prototype = FPDF()
+    for style in BROCHURE_FONT_STYLES:
+        prototype.set_font("Arial", style)
+    return prototype.fonts
+
+_PROTOTYPE_FONTS = _build_prototype_fonts()
+
+# FPDF state the header output depends on, and the state it leaves behind
+_HEADER_KEY_STATE = ('font_family', 'font_style', 'font_size_pt', 'underline',
+                     'fill_color', 'text_color', 'color_flag', 'x', 'y')
+_HEADER_END_STATE = _HEADER_KEY_STATE + ('font_size', 'current_font', 'unifontsubset', 'lasth')
+
+class _FileBuffer:
+    """Write-through stand-in for FPDF's str buffer: += appends to the file, len() is the byte offset used for the xref"""
+    def __init__(self, f):
+        self.f = f
+        self.size = 0
+    
+    def __iadd__(self, text):
+        data = text.encode("latin1")  # FPDF keeps the document as latin-1 text
+        self.f.write(data)
+        self.size += len(data)
+        return self
+    
+    def __len__(self):
+        return self.size
+
 class SamsungBrochurePDF(FPDF):
     def __init__(self):
         super().__init__()
+        # Share the (read-only) metrics, but copy each entry since output() stores object numbers on it
+        self.fonts = {key: dict(font) for key, font in _PROTOTYPE_FONTS.items()}
         self.set_auto_page_break(auto=True, margin=15)
         self.page_count = 0
+        self._header_cache = {}
         
     def header(self):
+        # The header is the same on every page: replay the content and cursor/font/colour state it produced
+        # last time it ran from the same starting state, instead of drawing it again
+        key = tuple(getattr(self, name) for name in _HEADER_KEY_STATE)
+        cached = self._header_cache.get(key)
+        if cached is not None:
+            content, state = cached
+            self.pages[self.page] += content
+            self.__dict__.update(state)
+            return
+        
+        offset = len(self.pages[self.page])
+        self._draw_header()
+        self._header_cache[key] = (
+            self.pages[self.page][offset:],
+            {name: getattr(self, name) for name in _HEADER_END_STATE}
+        )
+
+    def output_file(self, path):
+        """Like output(path), but writes the document to disk as it is assembled instead of building it in memory"""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                pending, self.buffer = self.buffer, _FileBuffer(f)
+                self.buffer += pending
+                self.close()
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _draw_header(self):
         # Samsung brand colors
         self.set_fill_color(20, 40, 85)  # Samsung blue
         self.rect(0, 0, 210, 25, 'F')
@@ -278,38 +419,33 @@ class SamsungBrochurePDF(FPDF):
         if formatted_value == "Not specified":
             return
         
+        label_text = clean_text_for_pdf(f"{label}:")
+        
         # Handle multi-line values
         if '\n' in formatted_value:
             # Label
             self.set_font("Arial", "B", 11)
             if indent > 0:
                 self.cell(indent)
-            self.cell(0, 6, clean_text_for_pdf(f"{label}:"), ln=True)
+            self.cell(0, 6, label_text, ln=True)
             
-            # Multi-line value
+            # Multi-line value, written as one indented block
             self.set_font("Arial", "", 10)
-            lines = formatted_value.split('\n')
-            for line in lines:
-                if indent > 0:
-                    self.cell(indent + 10)
-                else:
-                    self.cell(10)
-                self.cell(0, 5, clean_text_for_pdf(line), ln=True)
+            block = '\n'.join(clean_text_for_pdf(line) for line in formatted_value.split('\n'))
+            self.set_x(self.l_margin + indent + 10)
+            self.multi_cell(0, 5, block, align='L')  # left-aligned like the per-line cells it replaces
             self.ln(2)
         else:            # Single line field
             self.set_font("Arial", "B", 11)
             if indent > 0:
                 self.cell(indent)
-            self.cell(50, 6, clean_text_for_pdf(f"{label}:"))
+            self.cell(50, 6, label_text)
             
             self.set_font("Arial", "", 11)
             # Handle long values
             if len(formatted_value) > 60:
                 self.ln(6)
-                if indent > 0:
-                    self.cell(indent + 10)
-                else:
-                    self.cell(10)
+                self.set_x(self.l_margin + indent + 10)
                 self.multi_cell(0, 5, clean_text_for_pdf(formatted_value))
             else:
                 self.cell(0, 6, clean_text_for_pdf(formatted_value), ln=True)
@@ -324,14 +460,14 @@ class SamsungBrochurePDF(FPDF):
         # Create a grid layout for features
         self.set_font("Arial", "", 10)
         col_width = 85
-        x_start = self.get_x()
+        x_start = self.x
         
-        for i, feature in enumerate(features[:12]):  # Limit to 12 features
+        for i, feature in enumerate(features[:MAX_FEATURES]):
             if i > 0 and i % 2 == 0:
                 self.ln(6)
             
             x_pos = x_start + (i % 2) * col_width
-            self.set_xy(x_pos, self.get_y())
+            self.set_xy(x_pos, self.y)
             self.cell(5, 5, "*", ln=False)  # Use * instead of + or bullet
             self.cell(col_width - 5, 5, clean_text_for_pdf(str(feature)[:35]), ln=False)
         
@@ -343,7 +479,7 @@ class SamsungBrochurePDF(FPDF):
             self.add_section_header(left_title)
         
         # Store current position
-        start_y = self.get_y()
+        start_y = self.y
         left_x = 10
         right_x = 110
         col_width = 90
@@ -355,9 +491,9 @@ class SamsungBrochurePDF(FPDF):
         # Left column
         self.set_xy(left_x, start_y)
         for label, value in left_data.items():
-            if self.get_y() > 250:  # Near bottom of page
+            if self.y > 250:  # Near bottom of page
                 self.add_page()
-                start_y = self.get_y()
+                start_y = self.y
                 self.set_xy(left_x, start_y)
             
             self.set_font("Arial", "B", 10)
@@ -370,7 +506,7 @@ class SamsungBrochurePDF(FPDF):
             self.ln(2)
         
         # Record left column final position
-        left_y_max = self.get_y()
+        left_y_max = self.y
         
         # Right column
         right_y = start_y
@@ -383,7 +519,7 @@ class SamsungBrochurePDF(FPDF):
             self.ln(3)
         
         for label, value in right_data.items():
-            if self.get_y() > 250:  # Near bottom of page
+            if self.y > 250:  # Near bottom of page
                 break
             
             self.set_font("Arial", "B", 10)
@@ -397,13 +533,14 @@ class SamsungBrochurePDF(FPDF):
             self.ln(2)
         
         # Record right column final position
-        right_y_max = self.get_y()
+        right_y_max = self.y
         
         # Set cursor to the bottom of the longest column
         final_y = max(left_y_max, right_y_max)
         self.set_xy(10, final_y)
 
 # === SMART FIELD GROUPING ===
+@lru_cache(maxsize=8)
 def get_field_groups(product_type):
     """Define logical grouping of fields based on product type"""
     
@@ -448,22 +585,45 @@ def get_field_groups(product_type):
     
     return groups
 
-def extract_key_specs(product, product_type):
-    """Extract key specifications for highlight box"""
-    key_specs = {}
-    
+def get_spec_keys(product_type):
+    """Fields featured in the key specifications box"""
     if product_type == "phones":
-        spec_keys = ["display", "rear_camera", "front_camera", "battery_capacity", "storage", "ram", "os"]
+        return ["display", "rear_camera", "front_camera", "battery_capacity", "storage", "ram", "os"]
     elif product_type in ["watches", "watch"]:
-        spec_keys = ["display_size", "battery_life", "water_resistant", "os", "connectivity"]
+        return ["display_size", "battery_life", "water_resistant", "os", "connectivity"]
     elif product_type == "tv":
-        spec_keys = ["display_size", "resolution", "smart_features", "audio"]
+        return ["display_size", "resolution", "smart_features", "audio"]
     else:
-        spec_keys = ["model_name", "dimensions", "weight"]
+        return ["model_name", "dimensions", "weight"]
+
+@lru_cache(maxsize=8)
+def get_match_keys(product_type):
+    """Spec and group field keys looked up in every product of a type"""
+    field_groups = get_field_groups(product_type)
+    return (*get_spec_keys(product_type), *(key for keys in field_groups.values() for key in keys))
+
+def build_key_index(product_keys, field_keys):
+    """Map each field key to the product keys equal to, containing or contained in it (in product order)"""
+    return _build_key_index(tuple(product_keys), tuple(field_keys))
+
+@lru_cache(maxsize=64)
+def _build_key_index(product_keys, field_keys):
+    """Products of one type mostly share a key set, so the index is computed once per schema (read-only result)"""
+    return {
+        key: [k for k in product_keys if key in k or k in key]
+        for key in dict.fromkeys(field_keys)
+    }
+
+def extract_key_specs(product, product_type, key_index=None):
+    """Extract key specifications for highlight box"""
+    key_specs = {}
+    spec_keys = get_spec_keys(product_type)
+    if key_index is None:
+        key_index = build_key_index(product, spec_keys)
     
     for key in spec_keys:
         # Look for exact match or partial match
-        matching_keys = [k for k in product.keys() if k == key or key in k or k in key]
+        matching_keys = key_index[key]
         for match_key in matching_keys:
             if not should_skip_field(match_key, product[match_key]):
                 formatted_key = format_key(match_key)
@@ -472,6 +632,19 @@ def extract_key_specs(product, product_type):
     
     return key_specs
 
+def iter_features(features_raw):
+    """Yield feature strings from a list or a nested {group: [features] | feature} dict"""
+    # Handle different feature data structures
+    if isinstance(features_raw, list):
+        yield from features_raw
+    elif isinstance(features_raw, dict):
+        # Extract features from nested dictionary structure
+        for value in features_raw.values():
+            if isinstance(value, list):
+                yield from value
+            elif isinstance(value, str):
+                yield value
+
 def process_product_data(product, product_type):
     """Process and organize product data for display"""
     # Remove metadata fields
@@ -499,62 +672,112 @@ def process_product_data(product, product_type):
       # Group fields
     field_groups = get_field_groups(product_type)
     organized_data = {}
+    
+    # Resolve partial key matches for every spec and group field in one pass
+    key_index = build_key_index(clean_product, get_match_keys(product_type))
     used_fields = set()
     
-    # Extract features for special handling
+    # Extract features for special handling (only as many as the feature grid shows)
     features_raw = clean_product.get("special_features", clean_product.get("features", []))
-    features = []
-    
-    # Handle different feature data structures
-    if isinstance(features_raw, list):
-        features = features_raw
-    elif isinstance(features_raw, dict):
-        # Extract features from nested dictionary structure
-        for key, value in features_raw.items():
-            if isinstance(value, list):
-                features.extend(value)
-            elif isinstance(value, str):
-                features.append(value)
+    features = list(islice(iter_features(features_raw), MAX_FEATURES))
     
     if features_raw:
         used_fields.add("special_features")
         used_fields.add("features")
     
     # Extract key specifications
-    key_specs = extract_key_specs(clean_product, product_type)
+    key_specs = extract_key_specs(clean_product, product_type, key_index)
+    keys_by_label = {}
+    for k in clean_product:
+        keys_by_label.setdefault(format_key(k), []).append(k)
     for spec_key in key_specs:
         # Mark original field as used
-        original_keys = [k for k in clean_product.keys() if format_key(k) == spec_key]
-        used_fields.update(original_keys)
+        used_fields.update(keys_by_label.get(spec_key, []))
     
     # Organize fields into groups
+    skip_fields = {k for k, v in clean_product.items() if should_skip_field(k, v)}
     for group_name, field_keys in field_groups.items():
-        group_data = {}
-        for key in field_keys:
-            # Check for exact match or partial match
-            matching_keys = [k for k in clean_product.keys() if k == key or key in k or k in key]
-            for match_key in matching_keys[:3]:  # Limit to avoid duplicates
-                if match_key not in used_fields and not should_skip_field(match_key, clean_product[match_key]):
-                    group_data[format_key(match_key)] = clean_product[match_key]
-                    used_fields.add(match_key)
-        
-        if group_data:
-            organized_data[group_name] = group_data
+        # Check for exact match or partial match (at most 3 per field to avoid duplicates)
+        group_keys = [match_key for key in field_keys for match_key in key_index[key][:3]
+                      if match_key not in used_fields and match_key not in skip_fields]
+        if group_keys:
+            organized_data[group_name] = {format_key(k): clean_product[k] for k in group_keys}
+            used_fields.update(group_keys)
     
     # Add remaining fields to "Additional Information"
-    remaining_fields = {k: v for k, v in clean_product.items() 
-                      if k not in used_fields and not should_skip_field(k, v)}
-    
-    if remaining_fields:
-        additional_data = {}
-        for k, v in remaining_fields.items():
-            additional_data[format_key(k)] = v
-        if additional_data:
-            organized_data["Additional Information"] = additional_data
+    additional_data = {format_key(k): v for k, v in clean_product.items()
+                       if k not in used_fields and k not in skip_fields}
+    if additional_data:
+        organized_data["Additional Information"] = additional_data
     
     return brand, model, color, features, key_specs, organized_data
 
 # === MAIN EXECUTION ===
+def _render_one(date, product, product_type):
+    """Render one product's brochure; returns the progress lines so the parent can print them in order"""
+    log = []
+    try:
+        # Process product data
+        brand, model, color, features, key_specs, organized_data = process_product_data(product, product_type)
+        
+        # Create PDF
+        pdf = SamsungBrochurePDF()
+        pdf.add_page()
+          # Add title
+        pdf.add_title(brand, model, color)
+        
+        # Add key specifications in two-column layout
+        if key_specs:
+            half_point = len(key_specs) // 2
+            key_specs_items = list(key_specs.items())
+            left_specs = dict(key_specs_items[:half_point])
+            right_specs = dict(key_specs_items[half_point:])
+            pdf.add_two_column_layout(left_specs, right_specs, "Key Specifications")
+            pdf.ln(10)
+        
+        # Add features grid if available
+        if features:
+            pdf.add_feature_grid(features)
+        
+        # Add organized sections
+        for section_name, section_data in organized_data.items():
+            if section_data:  # Only add sections with data
+                pdf.add_section_header(section_name)
+                
+                for field_name, field_value in section_data.items():
+                    pdf.add_field(field_name, field_value)
+                
+                pdf.ln(5)
+        
+        # Find and add product images
+        image_paths = find_product_images(product_type)
+        if image_paths:
+            pdf.add_section_header("Product Images")
+            add_image_grid_to_pdf(pdf, image_paths, images_per_row=2)
+
+        
+        # Save PDF
+        safe_model = "".join(c for c in model if c.isalnum() or c in (' ', '-', '_')).strip()[:20]
+        filename = f"{product_type}_{date}_{safe_model.replace(' ', '_')}_brochure.pdf"
+        output_path = os.path.join(output_dir, filename)
+        
+        pdf.output_file(output_path)
+        log.append(f"[✓] Generated: {output_path}")
+        
+        # Print summary
+        total_fields = sum(len(section) for section in organized_data.values())
+        log.append(f"    📄 {len(organized_data)} sections, {total_fields} fields")
+        if features:
+            log.append(f"    ✨ {len(features)} key features highlighted")
+        if key_specs:
+            log.append(f"    🔑 {len(key_specs)} key specifications featured")
+            
+    except Exception as e:
+        log.append(f"[!] Error generating PDF for {date}: {e}")
+        import traceback
+        log.append(traceback.format_exc().rstrip("\n"))
+    return log
+
 def generate_brochure(product_type="phones"):
     """Generate professional PDF brochure from normalized JSON data"""
     
@@ -564,75 +787,26 @@ def generate_brochure(product_type="phones"):
         return
     
     try:
-        with open(input_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(input_file, "rb") as f:
+            data = orjson.loads(f.read())
     except Exception as e:
         print(f"[!] Error reading input file: {e}")
         return
     
     print(f"[*] Generating {product_type} brochures...")
     
-    for date, product in data.items():
-        try:
-            # Process product data
-            brand, model, color, features, key_specs, organized_data = process_product_data(product, product_type)
-            
-            # Create PDF
-            pdf = SamsungBrochurePDF()
-            pdf.add_page()
-              # Add title
-            pdf.add_title(brand, model, color)
-            
-            # Add key specifications in two-column layout
-            if key_specs:
-                half_point = len(key_specs) // 2
-                key_specs_items = list(key_specs.items())
-                left_specs = dict(key_specs_items[:half_point])
-                right_specs = dict(key_specs_items[half_point:])
-                pdf.add_two_column_layout(left_specs, right_specs, "Key Specifications")
-                pdf.ln(10)
-            
-            # Add features grid if available
-            if features:
-                pdf.add_feature_grid(features)
-            
-            # Add organized sections
-            for section_name, section_data in organized_data.items():
-                if section_data:  # Only add sections with data
-                    pdf.add_section_header(section_name)
-                    
-                    for field_name, field_value in section_data.items():
-                        pdf.add_field(field_name, field_value)
-                    
-                    pdf.ln(5)
-            
-            # Find and add product images
-            image_paths = find_product_images(product_type)
-            if image_paths:
-                pdf.add_section_header("Product Images")
-                add_image_grid_to_pdf(pdf, image_paths, images_per_row=2)
-
-            
-            # Save PDF
-            safe_model = "".join(c for c in model if c.isalnum() or c in (' ', '-', '_')).strip()[:20]
-            filename = f"{product_type}_{date}_{safe_model.replace(' ', '_')}_brochure.pdf"
-            output_path = os.path.join(output_dir, filename)
-            
-            pdf.output(output_path)
-            print(f"[✓] Generated: {output_path}")
-            
-            # Print summary
-            total_fields = sum(len(section) for section in organized_data.values())
-            print(f"    📄 {len(organized_data)} sections, {total_fields} fields")
-            if features:
-                print(f"    ✨ {len(features)} key features highlighted")
-            if key_specs:
-                print(f"    🔑 {len(key_specs)} key specifications featured")
-                
-        except Exception as e:
-            print(f"[!] Error generating PDF for {date}: {e}")
-            import traceback
-            traceback.print_exc()
+    # Each product becomes an independent PDF, so render them in parallel worker processes
+    items = list(data.items())
+    max_workers = min(os.cpu_count() or 1, len(items))
+    if max_workers <= 1:
+        for date, product in items:
+            print("\n".join(_render_one(date, product, product_type)))
+        return
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        dates, products = zip(*items)
+        for log in executor.map(_render_one, dates, products, [product_type] * len(items)):
+            print("\n".join(log))
 
 if __name__ == "__main__":
     generate_brochure(product_type)
@@ -1,17 +1,14 @@
-import pandas as pd
 from pathlib import Path
 
+COLUMNS = ["attribute", "variant", "value"]
+
 def load_csvs(data_dir="data"):
-    records = []
-    for csv_file in Path(data_dir).glob("*.csv"):
-        df = pd.read_csv(csv_file)
-        for _, row in df.iterrows():
-            records.append({
-                "attribute": row["attribute"],
-                "variant": row["variant"],
-                "value": row["value"]
-            })
-    return records
+    import pandas as pd  # Deferred: pandas is slow to import and only needed here
+    
+    frames = [pd.read_csv(csv_file, usecols=COLUMNS) for csv_file in Path(data_dir).glob("*.csv")]
+    if not frames:
+        return []
+    return pd.concat(frames, ignore_index=True)[COLUMNS].to_dict(orient="records")
 
 if __name__ == "__main__":
     data = load_csvs()
@@ -1,21 +1,41 @@
-import json
+import os
+import orjson
 from pathlib import Path
 
+COMBINED_FILE = "combined_scraped.json"
+
+def scraped_json_files(output_dir="output/"):
+    """Scraped JSON files in output_dir, excluding the combined file itself"""
+    return [f for f in Path(output_dir).glob("*.json") if f.name != COMBINED_FILE]
+
 def load_scraped_jsons(output_dir="output/"):
     combined = {}
-    for json_file in Path(output_dir).glob("*.json"):
+    for json_file in scraped_json_files(output_dir):
         product_key = json_file.stem  # e.g. phones_amazon_20240601
-        with open(json_file, "r", encoding="utf-8") as f:
-            combined[product_key] = json.load(f)
+        combined[product_key] = orjson.loads(json_file.read_bytes())
     return combined
 
-if __name__ == "__main__":
-    jsons = load_scraped_jsons()
-    for k, v in jsons.items():
-        print(f"{k}: {len(v)} specs")
+def write_combined_json(output_dir="output/", output_file=None):
+    """Stream every scraped JSON into one compact file, holding a single document in memory at a time"""
+    output_file = output_file or os.path.join(output_dir, COMBINED_FILE)
+    counts = {}
+    tmp_file = output_file + ".tmp"
+    with open(tmp_file, "wb") as out:
+        out.write(b"{")
+        for i, json_file in enumerate(scraped_json_files(output_dir)):
+            product_key = json_file.stem
+            data = orjson.loads(json_file.read_bytes())
+            counts[product_key] = len(data)
+            if i:
+                out.write(b",")
+            out.write(orjson.dumps(product_key) + b":" + orjson.dumps(data))
+        out.write(b"}")
+    os.replace(tmp_file, output_file)
+    return output_file, counts
 
-# write combined JSON to a file
-output_file = "output/combined_scraped.json"
-with open(output_file, "w", encoding="utf-8") as f:
-    json.dump(jsons, f, indent=2, ensure_ascii=False)
-    print(f"Combined JSON written to {output_file}")
\ No newline at end of file
+if __name__ == "__main__":
+    # write combined JSON to a file
+    output_file, counts = write_combined_json()
+    for k, n in counts.items():
+        print(f"{k}: {n} specs")
+    print(f"Combined JSON written to {output_file}")
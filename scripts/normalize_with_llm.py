@@ -5,9 +5,11 @@ Enhanced LLM normalization script that processes aggregated data from multiple s
 """
 
 import os
-import json
-import openai
-from time import sleep
+import tempfile
+import asyncio
+import orjson
+from functools import lru_cache
+from time import sleep, monotonic
 from dotenv import load_dotenv
 
 # === CONFIG ===
@@ -106,36 +108,179 @@ USER_TEMPLATE = """Normalize this {product_type} product data aggregated from mu
 Apply MDM normalization rules while preserving ALL meaningful technical specifications and details."""
 
 # === LLM CALL ===
+MODEL = "gpt-4.1-mini"
+MAX_TOKENS = 4096  # Increased for comprehensive output
+
+# Batch API: requests run server-side in parallel at half the price, results arrive within the window
+use_batch_api = True
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL = 5      # seconds, doubled after every poll...
+BATCH_POLL_MAX_INTERVAL = 60  # ...up to this
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Direct calls (use_batch_api = False): concurrent requests, spaced to stay under the rate limit
+MAX_CONCURRENT_REQUESTS = 16
+REQUESTS_PER_MINUTE = 50
+
+# Longer string values (e.g. marketing descriptions) are cut to this many characters in the prompt
+MAX_PROMPT_VALUE_CHARS = 2048
+
+# The system message is identical for every request, build it once
+SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT.strip()}
+
+@lru_cache(maxsize=1)
+def get_client():
+    """Shared OpenAI client, so every request reuses one connection pool"""
+    # Imported here so runs without an API key never pay for loading the OpenAI client
+    import openai
+    
+    return openai.OpenAI(api_key=api_key)
+
+def truncate_long_values(value):
+    """Copy of value with every string longer than MAX_PROMPT_VALUE_CHARS cut short"""
+    if isinstance(value, str):
+        return value if len(value) <= MAX_PROMPT_VALUE_CHARS else value[:MAX_PROMPT_VALUE_CHARS] + "…"
+    if isinstance(value, dict):
+        return {k: truncate_long_values(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [truncate_long_values(v) for v in value]
+    return value
+
+def build_messages(product_json: dict, product_type: str):
+    """Chat messages asking the model to normalize one product"""
+    # Compact JSON: indentation only adds input tokens, the model reads it the same
+    user_prompt = USER_TEMPLATE.format_map({
+        "data": orjson.dumps(truncate_long_values(product_json)).decode(),
+        "product_type": product_type
+    })
+    return [SYSTEM_MESSAGE, {"role": "user", "content": user_prompt.strip()}]
+
+def parse_reply(reply: str):
+    """Decode the model's JSON answer"""
+    # Try extracting JSON from code block if present
+    if "```json" in reply:
+        reply = reply.split("```json")[1].split("```")[0].strip()
+
+    return orjson.loads(reply)
+
 def call_gpt4o_cleaner(product_json: dict, product_type: str):
     if not api_key:
         print("[!] Skipping LLM normalization - no API key")
         return product_json  # Return original data if no API key
-    
-    user_prompt = USER_TEMPLATE.format(data=json.dumps(product_json, indent=2), product_type=product_type)
 
     try:
         # Updated OpenAI API call for newer versions
-        client = openai.OpenAI(api_key=api_key)
-        response = client.chat.completions.create(
-            model="gpt-4.1-mini",
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT.strip()},
-                {"role": "user", "content": user_prompt.strip()}
-            ],
+        response = get_client().chat.completions.create(
+            model=MODEL,
+            messages=build_messages(product_json, product_type),
             temperature=0.3,
-            max_tokens=4096  # Increased for comprehensive output
+            max_tokens=MAX_TOKENS
         )
-        reply = response.choices[0].message.content
-
-        # Try extracting JSON from code block if present
-        if "```json" in reply:
-            reply = reply.split("```json")[1].split("```")[0].strip()
-
-        return json.loads(reply)
+        return parse_reply(response.choices[0].message.content)
     except Exception as e:
         print(f"[!] Error normalizing product: {e}")
         return None
 
+class RateLimiter:
+    """Spaces request starts evenly so at most `per_minute` begin in any minute"""
+    def __init__(self, per_minute: int):
+        self.interval = 60 / per_minute
+        self.next_slot = 0.0
+        self.lock = asyncio.Lock()
+
+    async def wait(self):
+        async with self.lock:
+            now = monotonic()
+            delay = self.next_slot - now
+            self.next_slot = max(now, self.next_slot) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+async def normalize_concurrently(products: dict, product_type: str):
+    """Normalize every product with concurrent chat completion calls; returns {date: cleaned product or None}"""
+    import openai
+    
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    limiter = RateLimiter(REQUESTS_PER_MINUTE)
+
+    async def normalize_one(client, date, product):
+        async with semaphore:
+            await limiter.wait()
+            try:
+                response = await client.chat.completions.create(
+                    model=MODEL,
+                    messages=build_messages(product, product_type),
+                    temperature=0.3,
+                    max_tokens=MAX_TOKENS
+                )
+                return parse_reply(response.choices[0].message.content)
+            except Exception as e:
+                print(f"[!] Error normalizing product {date}: {e}")
+                return None
+
+    # Close the client's connection pool while the loop is still running
+    async with openai.AsyncOpenAI(api_key=api_key) as client:
+        results = await asyncio.gather(*(normalize_one(client, date, product) for date, product in products.items()))
+    return dict(zip(products, results))
+
+def normalize_with_batch(products: dict, product_type: str):
+    """Normalize every product in one Batch API job; returns {date: cleaned product} for the ones that succeeded"""
+    client = get_client()
+    
+    # Phase 1: one chat completion request per date, written to a temporary file that is gone once uploaded
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        batch_input_file = os.path.join(tmp_dir, f"{product_type}_batch_input.jsonl")
+        with open(batch_input_file, "wb") as f:
+            for date, product in products.items():
+                f.write(orjson.dumps({
+                    "custom_id": date,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": MODEL,
+                        "messages": build_messages(product, product_type),
+                        "temperature": 0.3,
+                        "max_tokens": MAX_TOKENS
+                    }
+                }) + b"\n")
+        
+        # Phase 2: upload, submit and wait for the batch
+        with open(batch_input_file, "rb") as f:
+            file_id = client.files.create(file=f, purpose="batch").id
+    batch = client.batches.create(
+        input_file_id=file_id,
+        endpoint="/v1/chat/completions",
+        completion_window=BATCH_COMPLETION_WINDOW
+    )
+    print(f"[*] Submitted batch {batch.id} with {len(products)} requests")
+    
+    interval = BATCH_POLL_INTERVAL
+    while batch.status not in BATCH_TERMINAL_STATUSES:
+        sleep(interval)
+        interval = min(interval * 2, BATCH_POLL_MAX_INTERVAL)
+        batch = client.batches.retrieve(batch.id)
+        print(f"  Batch status: {batch.status}")
+    
+    if batch.status != "completed" or not batch.output_file_id:
+        print(f"[!] Batch {batch.id} ended with status: {batch.status}")
+        return {}
+    
+    # Map custom_id (the date) back to the parsed reply
+    results = {}
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        record = orjson.loads(line)
+        date = record["custom_id"]
+        try:
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                raise ValueError(record.get("error") or response.get("body"))
+            results[date] = parse_reply(response["body"]["choices"][0]["message"]["content"])
+        except Exception as e:
+            print(f"[!] Error normalizing product {date}: {e}")
+    return results
+
 # === MAIN WORKFLOW ===
 def main():
     # Create output directory
@@ -146,23 +291,38 @@ def main():
         print(f"[!] Please run aggregate_all_sources.py first")
         exit(1)
 
-    with open(input_file, "r", encoding="utf-8") as f:
-        aggregated_data = json.load(f)
+    with open(input_file, "rb") as f:
+        aggregated_data = orjson.loads(f.read())
 
     final_result = {}
+    metadata_by_date = {}
 
     for date, product in aggregated_data.items():
         print(f"→ Normalizing {product_type} product from date: {date}")
         
         # Extract metadata if present
         metadata = product.pop("_metadata", {})
+        metadata_by_date[date] = metadata
         
         # Show source data richness
+        print(f"  Source data: {metadata.get('total_fields', len(product))} fields")
+
+    # Normalize with LLM
+    if not api_key:
+        cleaned_by_date = {date: call_gpt4o_cleaner(product, product_type) for date, product in aggregated_data.items()}
+    elif use_batch_api:
+        try:
+            cleaned_by_date = normalize_with_batch(aggregated_data, product_type)
+        except Exception as e:
+            print(f"[!] Batch normalization failed: {e}")
+            cleaned_by_date = {}
+    else:
+        cleaned_by_date = asyncio.run(normalize_concurrently(aggregated_data, product_type))
+
+    for date, product in aggregated_data.items():
+        metadata = metadata_by_date[date]
         source_fields = metadata.get("total_fields", len(product))
-        print(f"  Source data: {source_fields} fields")
-        
-        # Normalize with LLM
-        cleaned = call_gpt4o_cleaner(product, product_type)
+        cleaned = cleaned_by_date.get(date)
         if cleaned:
             # Add normalization metadata
             cleaned["_normalization_metadata"] = {
@@ -172,15 +332,18 @@ def main():
                 "source_metadata": metadata
             }
             final_result[date] = cleaned
-            print(f"  Normalized: {len(cleaned) - 1} fields (retention: {cleaned['_normalization_metadata']['field_retention_ratio']:.2%})")
+            print(f"  {date} normalized: {len(cleaned) - 1} fields (retention: {cleaned['_normalization_metadata']['field_retention_ratio']:.2%})")
         else:
             print(f"  [!] Failed to normalize data for {date}")
-        
-        sleep(1.1)  # Respect rate limits
+
+    # Keep the previous output when everything failed (e.g. the batch expired), the API and brochures read it
+    if aggregated_data and not final_result:
+        print(f"[!] No products were normalized, leaving {output_file} unchanged")
+        exit(1)
 
     # Save normalized data
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(final_result, f, indent=2, ensure_ascii=False)
+    with open(output_file, "wb") as f:
+        f.write(orjson.dumps(final_result, option=orjson.OPT_INDENT_2))
 
     print(f"\n[✓] Normalized data saved to: {output_file}")
     
@@ -1,12 +1,29 @@
 # [START — imports at top]
 import asyncio
-import json
+import orjson
 import logging
+import re
 import yaml
-import requests
+try:
+    from yaml import CSafeLoader as YamlLoader  # libyaml-backed, bundled with most PyYAML wheels
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+import aiohttp
 import hashlib
+import shutil
+import socket
+import time
+import msgspec
 from bs4 import BeautifulSoup
+try:
+    import lxml  # noqa: F401 - C parser for BeautifulSoup, much faster than html.parser on large product pages
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from functools import lru_cache
+from typing import Annotated
 from datetime import datetime
 from argparse import ArgumentParser
 import os
@@ -24,6 +41,109 @@ from crawl4ai.extraction_strategy import JsonCssExtractionStrategy
 logger = logging.getLogger(__name__)
 logging.basicConfig(format="%(asctime)s [%(levelname)s] %(message)s", level=logging.INFO)
 
+# [Text cleaning] zero-width and direction marks (e.g. U+200E after Amazon labels) stripped from extracted cells
+_ZERO_WIDTH_RE = re.compile(r"[\u200b-\u200f\u2060\ufeff]+")
+
+# [Image filtering] URLs or img attributes containing any of these are not product images
+EXCLUDE_KEYWORDS = [
+    'logo', 'icon', 'banner', 'ad', 'advertisement', 'promo', 'nav', 'navigation', 'header',
+    'footer', 'sidebar', 'social', 'facebook', 'twitter', 'instagram', 'placeholder', 'loading',
+    'spinner', 'avatar', 'badge', 'star', 'rating-star', 'checkout', 'cart', 'thumbnail'
+]
+_EXCLUDE_RE = re.compile("|".join(map(re.escape, EXCLUDE_KEYWORDS)), re.IGNORECASE)
+
+# [Image sections] containers (Amazon, then Flipkart, then generic) whose <img> tags are product images
+PRODUCT_SELECTORS = [
+    "#imageBlock", "#altImages", "#main-image-container", ".imgTagWrapper", "#imageBlock_feature_div",
+    "#productImageContainer", "div.Pz+aTd", "div._1BweB8", "img._0DkuPH", "div._396cs4",
+    "._20Gt85", "._2KpZ6l", "._30XEf0", ".CXW8mj", "._1AtVbE", "[data-id='LSTMOBGJXXADKMAVHZGXXMJT']",
+    '[data-testid*="product"]', '[class*="product"]', '.gallery', '.product-gallery', 'main',
+    'article', 'div[class*="image"]', 'div[class*="gallery"]'
+]
+_PRODUCT_SELECTOR = ", ".join(PRODUCT_SELECTORS)
+
+# [Image downloads]
+IMAGE_CONCURRENCY = 16
+IMAGE_RETRIES = 2  # retries on connection errors/timeouts, with 0.3s exponential backoff
+IMAGE_STORE_DIR = ".store"  # content-addressed copies under images/; per-source filenames are hardlinks to them
+IMAGE_URL_INDEX = "urls.json"  # in IMAGE_STORE_DIR, maps each fetched image URL to its stored file
+
+# [Browser] the same headless Chromium settings for every run, built once at import
+BROWSER_CFG = BrowserConfig(
+    browser_type="chromium",
+    headless=True,
+    extra_args=[
+        "--no-sandbox", "--disable-dev-shm-usage", "--disable-blink-features=AutomationControlled",
+        "--disable-extensions", "--no-first-run", "--disable-default-apps", "--disable-infobars",
+    ],
+    viewport_width=1280,
+    viewport_height=800,
+    text_mode=False,
+    verbose=False,
+)
+
+# [HTTP fast path] spec tables are server-rendered, so a plain GET usually has them; the browser is the fallback
+HTTP_FAST_PATH = True
+HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-IN,en;q=0.9',
+}
+
+def extract_table_rows(html: str, schema: dict) -> list:
+    """Rows for a JsonCssExtractionStrategy-style schema, with the same text extraction as Crawl4AI"""
+    soup = BeautifulSoup(html, HTML_PARSER)
+    rows = []
+    for element in soup.select(schema["baseSelector"]):
+        item = {}
+        for field in schema["fields"]:
+            cell = element.select_one(field["selector"])
+            if cell is not None:
+                item[field["name"]] = cell.get_text(strip=True)
+        if item:
+            rows.append(item)
+    return rows
+
+# [Scrape concurrency] caps how many pages are open in the shared browser at once
+MAX_CONCURRENT_SCRAPES = 3
+
+# [Scrape cache] a URL scraped successfully within this many seconds is not fetched again (0 disables)
+SCRAPE_CACHE_TTL = 6 * 60 * 60
+
+# [URL dedup] query parameters that only track the visit; dropped when comparing URLs
+TRACKING_PARAMS = {"tag", "ref", "ref_", "psc", "gclid", "fbclid", "lid", "marketplace", "srno", "otracker", "fm", "iid", "ppt", "ppn", "ssid"}
+
+def normalize_url(url: str) -> str:
+    """URL with host lowercased, fragment, trailing slash and tracking parameters removed"""
+    parts = urlsplit(url.strip())
+    query = urlencode([
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith("utm_")
+    ])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), query, ""))
+
+# [Config schema]
+class UrlEntry(msgspec.Struct, frozen=True):
+    source: str
+    url: str
+
+# Frozen so one parsed config can be shared by every runner built from the same file
+class ScrapeConfig(msgspec.Struct, frozen=True):
+    category: str
+    urls: Annotated[tuple[UrlEntry, ...], msgspec.Meta(min_length=1)]
+    api_token_primary: str
+    api_token_secondary: str
+
+@lru_cache(maxsize=100)
+def _parse_config(path: str, mtime_ns: int, size: int) -> ScrapeConfig:
+    """Parse and validate a config file; mtime and size are part of the key so edits are picked up"""
+    with open(path, "r", encoding="utf-8") as fh:
+        raw = yaml.load(fh, Loader=YamlLoader)
+    try:
+        return msgspec.convert(raw, ScrapeConfig)
+    except msgspec.ValidationError as e:
+        raise ValueError(f"Invalid config {path}: {e}") from e
+
 # [Main ScrapeRunner class]
 class ScrapeRunner:
     AMAZON_SCHEMA = {
@@ -44,6 +164,10 @@ class ScrapeRunner:
         ],
     }
 
+    # Strategies depend only on the schemas above, build them once for every scrape
+    AMAZON_STRATEGY = JsonCssExtractionStrategy(schema=AMAZON_SCHEMA, multiple=False)
+    FLIPKART_STRATEGY = JsonCssExtractionStrategy(schema=FLIPKART_SCHEMA, multiple=False)
+
     def __init__(self, config_path: Path):
         self.config_path = config_path
         self.load_config()
@@ -53,35 +177,70 @@ class ScrapeRunner:
     def load_config(self):
         if not self.config_path.exists():
             raise FileNotFoundError(f"Config not found: {self.config_path}")
-        with self.config_path.open("r", encoding="utf-8") as fh:
-            self.cfg = yaml.safe_load(fh)
-
-        required_keys = ["category", "urls", "api_token_primary", "api_token_secondary"]
-        for key in required_keys:
-            if key not in self.cfg:
-                raise KeyError(f"Missing '{key}' in config {self.config_path}")
+        st = self.config_path.stat()
+        self.cfg = _parse_config(str(self.config_path), st.st_mtime_ns, st.st_size)
 
-        self.category = self.cfg["category"]
-        self.urls = self.cfg["urls"]
-        self.api_token_primary = self.cfg["api_token_primary"]
-        self.api_token_secondary = self.cfg["api_token_secondary"]
+        self.category = self.cfg.category
+        self.urls = self.cfg.urls
+        self.api_token_primary = self.cfg.api_token_primary
+        self.api_token_secondary = self.cfg.api_token_secondary
 
-        if not isinstance(self.urls, list) or len(self.urls) == 0:
-            raise ValueError("Config 'urls' must be a non-empty list")
-        for entry in self.urls:
-            if "source" not in entry or "url" not in entry:
-                raise KeyError("Each entry in 'urls' must have 'source' and 'url'")
+    def _token_for(self, source: str) -> str:
+        return self.api_token_primary if source == "amazon" else self.api_token_secondary
 
     async def run(self):
-        results = []
-        for entry in self.urls:
-            source = entry["source"].lower()
-            url = entry["url"]
-            token = self.api_token_primary if source == "amazon" else self.api_token_secondary
-            res = await self.scrape_one(source, url, token)
-            results.append(res)
-
-        for res in results:
+        self._scrape_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+        results = [None] * len(self.urls)
+        jobs = []
+        first_entry = {}  # (source, normalized URL) -> index of the entry that scrapes it
+        duplicates = []  # (index, index of the first entry with the same source and URL)
+        for i, entry in enumerate(self.urls):
+            source = entry.source.lower()
+            url = entry.url
+            # The same URL under another source is scraped with that source's schema and saved separately
+            key = (source, normalize_url(url))
+            if key in first_entry:
+                logger.info(f"Skipping duplicate URL for '{source}' @ {url!r}")
+                duplicates.append((i, first_entry[key]))
+                continue
+            first_entry[key] = i
+            cached = self.load_cached(source, url)
+            if cached is not None:
+                logger.info(f"Using cached scrape for '{source}' @ {url!r} ({cached['json_file']})")
+                results[i] = cached
+                continue
+            jobs.append((i, source, url, self._token_for(source)))
+
+        if jobs:
+            # Resolve the product hosts while the HTTP fetches run; a browser fallback waits for these before its
+            # first navigation (see get_crawler), so Chromium finds a warm resolver cache
+            hosts = {urlsplit(url).hostname for _, _, url, _ in jobs} - {None}
+            loop = asyncio.get_running_loop()
+            self._prewarm = asyncio.gather(
+                *(loop.getaddrinfo(host, 443, type=socket.SOCK_STREAM) for host in hosts),
+                return_exceptions=True,
+            )
+            # One browser for the whole run, launched only if some page needs it; each URL gets its own page
+            self._crawler = None
+            self._crawler_lock = asyncio.Lock()
+            try:
+                scraped = await asyncio.gather(
+                    *(self.scrape_one(source, url, token) for _, source, url, token in jobs),
+                    return_exceptions=True,
+                )
+            finally:
+                if self._crawler is not None:
+                    await self._crawler.close()
+                    self._crawler = None
+            await self._prewarm
+            for (i, *_), res in zip(jobs, scraped):
+                results[i] = res
+        for i, first in duplicates:
+            results[i] = results[first]
+
+        for entry, res in zip(self.urls, results):
+            if isinstance(res, Exception):
+                res = {"source": entry.source.lower(), "status": "error", "error": str(res)}
             src = res.get("source", "?")
             status = res.get("status", "unknown")
             if status == "success":
@@ -89,45 +248,90 @@ class ScrapeRunner:
             else:
                 logger.error(f"  ✗ {src} → {res.get('error')}")
 
+    def _cache_meta_path(self, source: str, url: str) -> Path:
+        # The schema is part of the key, so editing a selector invalidates results extracted with the old one
+        schema = ScrapeRunner.AMAZON_SCHEMA if source == "amazon" else ScrapeRunner.FLIPKART_SCHEMA
+        schema_hash = hashlib.blake2b(orjson.dumps(schema, option=orjson.OPT_SORT_KEYS), digest_size=8).hexdigest()
+        cache_key = hashlib.blake2b(f"{url}|{source}|{schema_hash}".encode(), digest_size=16).hexdigest()
+        return self.output_base / ".cache" / f"{cache_key}.meta.json"
+
+    def load_cached(self, source: str, url: str) -> dict | None:
+        """Return the previous result for url if it was scraped within SCRAPE_CACHE_TTL with the current schema"""
+        meta_path = self._cache_meta_path(source, url)
+        try:
+            meta = orjson.loads(meta_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        if time.time() - meta.get("fetched_at", 0) >= SCRAPE_CACHE_TTL or not Path(meta.get("json_file", "")).exists():
+            return None
+        return {"source": source, "status": "success", "json_file": meta["json_file"], "images": meta.get("images", [])}
+
+    def save_cached(self, url: str, res: dict) -> None:
+        meta_path = self._cache_meta_path(res["source"], url)
+        meta_path.parent.mkdir(exist_ok=True)
+        tmp_path = meta_path.with_suffix(".tmp")
+        tmp_path.write_bytes(orjson.dumps({"url": url, "fetched_at": time.time(), "json_file": res["json_file"], "images": res["images"]}))
+        os.replace(tmp_path, meta_path)
+
+    async def get_crawler(self) -> AsyncWebCrawler:
+        """The run's shared crawler, started on first use"""
+        async with self._crawler_lock:
+            if self._crawler is None:
+                crawler = AsyncWebCrawler(config=BROWSER_CFG)
+                # Host lookups finish alongside the browser launch, before any page is requested
+                await asyncio.gather(self._prewarm, crawler.start())
+                self._crawler = crawler
+        return self._crawler
+
+    async def fetch_static(self, source: str, url: str):
+        """Fetch the page over plain HTTP; (html, rows) if the spec table is in the served HTML, else None"""
+        schema = ScrapeRunner.AMAZON_SCHEMA if source == "amazon" else ScrapeRunner.FLIPKART_SCHEMA
+        try:
+            async with aiohttp.ClientSession(headers=HTTP_HEADERS, timeout=aiohttp.ClientTimeout(total=20)) as session:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    html = await response.text()
+        except Exception as e:
+            logger.info(f"HTTP fetch failed for {source}, falling back to the browser: {e}")
+            return None
+
+        rows = await asyncio.to_thread(extract_table_rows, html, schema)
+        if not rows:
+            # e.g. a CAPTCHA or bot-check page instead of the product
+            logger.info(f"No spec table in the HTTP response for {source}, falling back to the browser")
+            return None
+        return html, rows
+
     async def scrape_one(self, source: str, url: str, api_token: str) -> dict:
         logger.info(f"Scraping '{source}' @ {url!r}")
 
-        browser_cfg = BrowserConfig(
-            browser_type="chromium",
-            headless=True,
-            extra_args=[
-                "--no-sandbox", "--disable-dev-shm-usage", "--disable-blink-features=AutomationControlled",
-                "--disable-extensions", "--no-first-run", "--disable-default-apps", "--disable-infobars",
-            ],
-            viewport_width=1280,
-            viewport_height=800,
-            text_mode=False,
-            verbose=False,
-        )
+        if HTTP_FAST_PATH:
+            fetched = await self.fetch_static(source, url)
+            if fetched is not None:
+                html, raw_extracted = fetched
+                return await self.save_scrape(source, url, html, raw_extracted)
 
         llm_cfg = LLMConfig(
             provider="gemini/gemma-3-27b-it",
             api_token=api_token
         )
 
-        schema = ScrapeRunner.AMAZON_SCHEMA if source == "amazon" else ScrapeRunner.FLIPKART_SCHEMA
+        strategy = ScrapeRunner.AMAZON_STRATEGY if source == "amazon" else ScrapeRunner.FLIPKART_STRATEGY
         wait_for = "css:table#productDetails_techSpec_section_1" if source == "amazon" else "css:table._0ZhAN9"
 
-        strategy = JsonCssExtractionStrategy(schema=schema, multiple=False)
-
         run_cfg = CrawlerRunConfig(
             cache_mode=CacheMode.BYPASS,
             extraction_strategy=strategy,
             wait_for=wait_for,
             page_timeout=120_000,
             js_code=["window.scrollTo(0, document.body.scrollHeight);"],
-            delay_before_return_html=2.0,
             screenshot=False,
             verbose=False
         )
 
         try:
-            async with AsyncWebCrawler(config=browser_cfg) as crawler:
+            async with self._scrape_semaphore:
+                crawler = await self.get_crawler()
                 result = await crawler.arun(url=url, config=run_cfg)
         except Exception as e:
             logger.exception(f"Exception while scraping {source}")
@@ -136,111 +340,61 @@ class ScrapeRunner:
         if not getattr(result, "success", False):
             return {"source": source, "status": "error", "error": getattr(result, "error_message", "unknown")}
 
+        return await self.save_scrape(source, url, result.html, result.extracted_content)
+
+    async def save_scrape(self, source: str, url: str, html: str, raw_extracted) -> dict:
+        """Clean and write the extracted rows, download the page's product images"""
         def _clean_text(s: str) -> str:
-            return s.replace("\u200e", "").strip()
+            return _ZERO_WIDTH_RE.sub("", s).strip()
+
+        def _clean_rows(rows) -> list:
+            return [{"label": _clean_text(row.get("label", "")), "value": _clean_text(row.get("value", ""))} for row in rows]
 
-        raw_extracted = result.extracted_content
-        cleaned_rows = []
         if isinstance(raw_extracted, list):
-            for row in raw_extracted:
-                lbl = row.get("label", "")
-                val = row.get("value", "")
-                cleaned_rows.append({"label": _clean_text(lbl), "value": _clean_text(val)})
-            extracted = cleaned_rows
+            extracted = _clean_rows(raw_extracted)
         elif isinstance(raw_extracted, str):
             try:
-                parsed = json.loads(raw_extracted)
-                for row in parsed:
-                    lbl = row.get("label", "")
-                    val = row.get("value", "")
-                    cleaned_rows.append({"label": _clean_text(lbl), "value": _clean_text(val)})
-                extracted = cleaned_rows
+                extracted = _clean_rows(orjson.loads(raw_extracted))
             except Exception:
                 extracted = _clean_text(raw_extracted)
 
         # Save JSON
-        json_path = self.output_base / f"{self.category}_{source}_{datetime.now():%Y%m%d_%H%M%S}.json"
-        with json_path.open("w", encoding="utf-8") as f:
-            json.dump(extracted, f, indent=2, ensure_ascii=False)        # EXTRA — Download images with selective filtering
-        def download_images_from_html(html, source, date_str):
+        # One timestamp per scrape, so the JSON and its images always carry the same date_str
+        date_str = datetime.now().strftime("%Y%m%d_%H%M%S")
+        json_path = self.output_base / f"{self.category}_{source}_{date_str}.json"
+        # Written from a worker thread so the other scrapes on the event loop keep running
+        await asyncio.to_thread(json_path.write_bytes, orjson.dumps(extracted, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+
+        # EXTRA — Download images with selective filtering
+        async def download_images_from_html(html, source, date_str):
             script_dir = os.path.dirname(os.path.abspath(__file__))
             project_root = os.path.dirname(script_dir)
             img_dir = Path(project_root) / "images"
             img_dir.mkdir(exist_ok=True)  # Ensure the images directory exists
-            soup = BeautifulSoup(html, "html.parser")
+            store_dir = img_dir / IMAGE_STORE_DIR
+            store_dir.mkdir(exist_ok=True)
+            soup = BeautifulSoup(html, HTML_PARSER)
             
-            # Get image selectors from config or use defaults
-            product_selectors = [
-                "#imageBlock", "#altImages", "#main-image-container", ".imgTagWrapper", "#imageBlock_feature_div",
-                "#productImageContainer", "div.Pz+aTd", "div._1BweB8", "img._0DkuPH", "div._396cs4",
-                "._20Gt85", "._2KpZ6l", "._30XEf0", ".CXW8mj", "._1AtVbE", "[data-id='LSTMOBGJXXADKMAVHZGXXMJT']",
-                '[data-testid*="product"]', '[class*="product"]', '.gallery', '.product-gallery', 'main',
-                'article', 'div[class*="image"]', 'div[class*="gallery"]'
-]
-
-            exclude_keywords = [
-                'logo', 'icon', 'banner', 'ad', 'advertisement', 'promo', 'nav', 'navigation', 'header',
-                'footer', 'sidebar', 'social', 'facebook', 'twitter', 'instagram', 'placeholder', 'loading',
-                'spinner', 'avatar', 'badge', 'star', 'rating-star', 'checkout', 'cart', 'thumbnail'
-    ]   
-
             min_size = {"width": 200, "height": 200}
             min_file_size = 10000
             max_file_size = 5000000  # 5 MB
-            # Default selectors if none provided in config
-            if not product_selectors:
-                product_selectors = [
-                    # Common product image containers
-                    '[data-testid*="product"]',
-                    '[class*="product"]',
-                    '[id*="product"]',
-                    '.gallery',
-                    '.product-gallery',
-                    '.product-images',
-                    '.product-photos',
-                    '.item-gallery',
-                    '#product-details',
-                    '#product-info',
-                    '.pdp-', # Product Detail Page
-                    '[data-component*="product"]',
-                    '.main-content',
-                    '.content-main',
-                    # Amazon specific
-                    '#feature-bullets',
-                    '#productDetails',
-                    '#detailBullets_feature_div',
-                    '.a-carousel-container',
-                    '.image-wrapper',
-                    '.imgTagWrapper',
-                    # Generic content areas (avoid headers, footers, ads)
-                    'main',
-                    'article',
-                    '.container:has(img)',
-                ]
-            
-            # Default exclude keywords if none provided
-            if not exclude_keywords:
-                exclude_keywords = [
-                    'logo', 'icon', 'banner', 'ad', 'advertisement', 'promo',
-                    'nav', 'navigation', 'header', 'footer', 'sidebar',
-                    'social', 'facebook', 'twitter', 'instagram',                    'placeholder', 'loading', 'spinner', 'avatar',
-                    'badge', 'star', 'rating-star', 'checkout', 'cart'
-                ]
-            
-            saved_images = []
             images_found = []
             downloaded_urls = set()  # Track URLs to avoid duplicates
             
             # First, try to find images in specific product sections
-            for selector in product_selectors:
-                try:
-                    sections = soup.select(selector)
-                    for section in sections:
-                        section_images = section.find_all("img")
-                        images_found.extend(section_images)
-                except Exception as e:
-                    logger.debug(f"Selector '{selector}' failed: {e}")
-                    continue
+            # One selector union walks the DOM once and returns each matching section once, in document order
+            try:
+                sections = soup.select(_PRODUCT_SELECTOR)
+            except Exception as e:
+                logger.debug(f"Product selectors failed: {e}")
+                sections = []
+            # Containers nest (#imageBlock > #altImages > .imgTagWrapper), so keep each <img> node once
+            seen_nodes = set()
+            for section in sections:
+                for img in section.find_all("img"):
+                    if id(img) not in seen_nodes:
+                        seen_nodes.add(id(img))
+                        images_found.append(img)
               # If no images found in specific sections, fall back to all images but with stricter filtering
             if not images_found:
                 logger.info(f"No images found in product sections for {source}, falling back to all images with filtering")
@@ -249,6 +403,7 @@ class ScrapeRunner:
             logger.info(f"Found {len(images_found)} potential product images for {source}")
             
             processed_count = 0
+            candidates = []  # (src, file_ext) that passed the filters, in page order
             for img in images_found:
                 processed_count += 1
                 # Get image source
@@ -270,8 +425,7 @@ class ScrapeRunner:
                     continue
                     
                 # Filter out unwanted images by URL patterns
-                src_lower = src.lower()
-                if any(keyword in src_lower for keyword in exclude_keywords):
+                if _EXCLUDE_RE.search(src):
                     logger.debug(f"Skipping image due to exclude keyword: {src}")
                     continue
                 
@@ -290,59 +444,136 @@ class ScrapeRunner:
                 img_class = " ".join(img.get("class", []))
                 img_alt = img.get("alt", "")
                 img_attrs = img_class + " " + img_alt + " " + str(img.get("data-testid", ""))
-                if any(keyword in img_attrs.lower() for keyword in exclude_keywords):
+                if _EXCLUDE_RE.search(img_attrs):
                     logger.debug(f"Skipping image due to attribute keyword: {src}")
                     continue
                 
+                # Get file extension from URL or default to jpg
+                file_ext = ".jpg"
+                if "." in src.split("/")[-1]:
+                    potential_ext = "." + src.split(".")[-1].split("?")[0]
+                    if potential_ext.lower() in [".jpg", ".jpeg", ".png", ".webp", ".gif"]:
+                        file_ext = potential_ext
+                
+                downloaded_urls.add(src)
+                candidates.append((src, file_ext))
+            
+            # src -> stored filename for every image fetched before, so known URLs are linked without a request
+            url_index_path = store_dir / IMAGE_URL_INDEX
+            try:
+                url_index = orjson.loads(url_index_path.read_bytes())
+            except (OSError, orjson.JSONDecodeError):
+                url_index = {}
+            new_urls = {}
+            
+            def store_image(body, file_ext):
+                """Write body once under its content hash; returns the stored path"""
+                digest = hashlib.blake2b(body, digest_size=16).hexdigest()  # dedup key only, not security
+                stored = store_dir / f"{self.category}_{digest}{file_ext}"
+                if not stored.exists():
+                    tmp_path = stored.with_name(stored.name + ".part")
+                    tmp_path.write_bytes(body)
+                    os.replace(tmp_path, stored)
+                return stored
+            
+            def link_image(stored):
+                """Link a stored image in under this source's name; None if this run already has it"""
+                filepath = img_dir / f"{self.category}_{source}_{date_str}_{stored.name.removeprefix(self.category + '_')}"
+                if filepath.exists():
+                    return None
                 try:
-                    # Get file extension from URL or default to jpg
-                    file_ext = ".jpg"
-                    if "." in src.split("/")[-1]:
-                        potential_ext = "." + src.split(".")[-1].split("?")[0]
-                        if potential_ext.lower() in [".jpg", ".jpeg", ".png", ".webp", ".gif"]:
-                            file_ext = potential_ext
-                    
-                    filename = hashlib.md5(src.encode()).hexdigest() + file_ext
-                    filepath = filepath = img_dir / f"{self.category}_{source}_{date_str}_{filename}"
-
-                    
-                    # Download with headers to avoid blocking
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                    }
-                    response = requests.get(src, timeout=10, headers=headers)
-                    response.raise_for_status()
-                    
-                    # Check if it's actually an image by content type
-                    content_type = response.headers.get('content-type', '')
-                    if 'image' not in content_type.lower():
-                        continue
-                    
-                    # Check minimum file size (avoid tiny images)
-                    if len(response.content) < min_file_size:
-                        continue
-                    with open(filepath, "wb") as img_file:
-                        img_file.write(response.content)
+                    os.link(stored, filepath)
+                except OSError:
+                    shutil.copyfile(stored, filepath)  # no hardlinks on this filesystem
+                return filepath
+            
+            async def download_one(session, semaphore, src, file_ext):
+                """Fetch one image into memory and save it; returns the saved path or None if it was rejected"""
+                stored_name = url_index.get(src)
+                if stored_name and (store_dir / stored_name).exists():
+                    filepath = link_image(store_dir / stored_name)
+                    if filepath is not None:
+                        logger.info(f"Reused stored product image: {src}")
+                    return str(filepath) if filepath else None
+                
+                for attempt in range(IMAGE_RETRIES + 1):
+                    try:
+                        async with semaphore, session.get(src) as response:
+                            response.raise_for_status()
+                            
+                            # Check if it's actually an image by content type
+                            content_type = response.headers.get('content-type', '')
+                            if 'image' not in content_type.lower():
+                                return None
+                            
+                            # Reject tiny or oversized images from the declared length, before reading the body
+                            content_length = response.headers.get('content-length', '')
+                            if content_length.isdigit() and not min_file_size <= int(content_length) <= max_file_size:
+                                return None
+                            
+                            body = bytearray()
+                            async for chunk in response.content.iter_chunked(65536):
+                                body += chunk
+                                if len(body) > max_file_size:
+                                    break
+                        
+                        # Check minimum file size (avoid tiny images) and the maximum for unsized responses
+                        if len(body) < min_file_size or len(body) > max_file_size:
+                            return None
+                        # Sources often serve the same picture from different CDN URLs; save each picture once
+                        stored = store_image(body, file_ext)
+                        new_urls[src] = stored.name
+                        filepath = link_image(stored)
+                        if filepath is None:
+                            logger.debug(f"Skipping duplicate image: {src}")
+                            return None
+                        
+                        logger.info(f"Downloaded product image: {src}")
+                        return str(filepath)
                     
-                    downloaded_urls.add(src)  # Mark as downloaded
-                    saved_images.append(str(filepath))
-                    logger.info(f"Downloaded product image: {src}")
+                    except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                        if attempt == IMAGE_RETRIES:
+                            logger.warning(f"Failed to download image {src}: {e}")
+                            return None
+                        await asyncio.sleep(0.3 * 2 ** attempt)
                     
-                except Exception as e:
-                    logger.warning(f"Failed to download image {src}: {e}")
+                    except Exception as e:
+                        logger.warning(f"Failed to download image {src}: {e}")
+                        return None
+            
+            # Image downloads are network-bound, fetch them concurrently on the event loop over one pooled session
+            semaphore = asyncio.Semaphore(IMAGE_CONCURRENCY)
+            async with aiohttp.ClientSession(
+                headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'},
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as session:
+                results = await asyncio.gather(*(download_one(session, semaphore, src, file_ext) for src, file_ext in candidates))
+            saved_images = [saved for saved in results if saved]
+            
+            # Re-read before writing so entries added by scrapes running alongside this one are kept
+            if new_urls:
+                try:
+                    url_index = orjson.loads(url_index_path.read_bytes())
+                except (OSError, orjson.JSONDecodeError):
+                    url_index = {}
+                url_index.update(new_urls)
+                tmp_path = url_index_path.with_name(url_index_path.name + ".part")
+                tmp_path.write_bytes(orjson.dumps(url_index))
+                os.replace(tmp_path, url_index_path)
             
             logger.info(f"Successfully downloaded {len(saved_images)} product images for {source}")
             return saved_images
 
-        date_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-        images_saved = download_images_from_html(result.html, source, date_str)
+        images_saved = await download_images_from_html(html, source, date_str)
 
-        return {
+        res = {
             "source": source,
             "status": "success",
             "json_file": str(json_path),
             "images": images_saved
         }
+        self.save_cached(url, res)
+        return res
 
 # ────────────────────────────────
 if __name__ == "__main__":
@@ -7,8 +7,13 @@ import os
 import sys
 import subprocess
 import shutil
+import hashlib
 from pathlib import Path
 
+# uv (when installed) creates the venv and resolves/installs requirements much faster than venv + pip
+UV = shutil.which("uv")
+REQUIREMENTS_STAMP = ".requirements.sha256"  # inside the venv, hash of the requirements it was installed from
+
 def setup_venv():
     """Setup and activate virtual environment"""
     venv_path = Path(".venv")
@@ -17,7 +22,10 @@ def setup_venv():
     if not venv_path.exists():
         print("Creating virtual environment...")
         try:
-            subprocess.run([sys.executable, "-m", "venv", str(venv_path)], check=True)
+            if UV:
+                subprocess.run([UV, "venv", "--python", sys.executable, str(venv_path)], check=True)
+            else:
+                subprocess.run([sys.executable, "-m", "venv", str(venv_path)], check=True)
         except subprocess.CalledProcessError as e:
             print(f"Failed to create virtual environment: {e}")
             print("Trying alternative method...")
@@ -44,7 +52,10 @@ def recreate_venv():
         shutil.rmtree(venv_path)
     
     print("Creating fresh virtual environment...")
-    subprocess.run([sys.executable, "-m", "venv", str(venv_path)], check=True)
+    if UV:
+        subprocess.run([UV, "venv", "--python", sys.executable, str(venv_path)], check=True)
+    else:
+        subprocess.run([sys.executable, "-m", "venv", str(venv_path)], check=True)
     
     # Get the path to the Python executable in the venv
     if sys.platform == "win32":
@@ -55,12 +66,32 @@ def recreate_venv():
     return str(python_path)
 
 def install_requirements(python_path):
-    """Install required packages"""
+    """Install required packages unless they were already installed from this requirements.txt"""
     requirements_file = Path("requirements.txt")
     if not requirements_file.exists():
         print("Error: requirements.txt not found")
         sys.exit(1)
     
+    # Skip installing when requirements.txt and the Python version match the last successful install
+    stamp_file = Path(python_path).parent.parent / REQUIREMENTS_STAMP
+    requirements_hash = hashlib.sha256(
+        requirements_file.read_bytes() + f"{sys.version_info[0]}.{sys.version_info[1]}".encode()
+    ).hexdigest()
+    if stamp_file.exists() and stamp_file.read_text().strip() == requirements_hash:
+        print("Requirements unchanged, skipping install")
+        return
+    
+    install_packages(python_path, requirements_file)
+    stamp_file.write_text(requirements_hash)
+
+def install_packages(python_path, requirements_file):
+    """Run the actual install with uv or pip"""
+    # uv installs straight into the venv's interpreter, no pip needed there
+    if UV:
+        print("Installing requirements with uv...")
+        subprocess.run([UV, "pip", "install", "-r", str(requirements_file), "--python", python_path], check=True)
+        return
+    
     # First ensure pip is available
     print("Ensuring pip is available...")
     try:
@@ -86,7 +117,14 @@ def start_api_server(python_path):
         sys.exit(1)
     
     print("Starting API server...")
-    subprocess.run([python_path, str(api_script)], check=True)
+    if sys.platform == "win32":
+        # Windows has no real exec, os.execv would detach the server from this console
+        subprocess.run([python_path, str(api_script)], check=True)
+        return
+    
+    # Replace this bootstrap process with the server, so it gets signals directly and no idle parent is left
+    sys.stdout.flush()
+    os.execv(python_path, [python_path, str(api_script)])
 
 if __name__ == "__main__":
     # Get the project root directory